@@ -69,6 +69,7 @@ const dom = {
 
 const DEFAULT_STOCK_INTERVAL_SEC = 120;
 const MIN_STOCK_INTERVAL_SEC = 120;
+const STOCK_PENDING_RETRY_MS = 3000;
 const STALE_DATA_SECONDS = 60;
 const MAX_HISTORY_POINTS = 300;
 const HISTORY_STORAGE_KEY = "priceHistoryV1";
@@ -97,12 +98,17 @@ const state = {
   stockIntervalMs: DEFAULT_STOCK_INTERVAL_SEC * 1000,
   cryptoIntervalMs: 15000,
   stockTimer: null,
+  stockRetryTimer: null,
+  stockStream: null,
+  stockStreamDisabled: false,
   cryptoTimer: null,
 };
 
 const stockRows = new Map();
 const cryptoRows = new Map();
 const latestStocks = new Map();
+const stockItems = new Map();
+const stocksOk = new Set();
 const latestCryptos = new Map();
 const history = new Map();
 let historySaveTimer = null;
@@ -1569,114 +1575,195 @@ async function fetchCryptoBatch() {
   return response.json();
 }
 
-async function updateStocks() {
-  setStatus(dom.stockStatus, "Acciones: actualizando...");
-  try {
-    const payload = await fetchStocksBatch();
-    const data = payload.data;
-    const mapped = new Map(data.map((item) => [item.symbol, item]));
-    let okCount = 0;
+function applyStockItem(symbol, item) {
+  const row = stockRows.get(symbol);
+  if (!row) return false;
+  if (!item) {
+    stockItems.delete(symbol);
+    updateRow(row, { error: "Sin datos" });
+    return false;
+  }
+  if (item.error) {
+    stockItems.delete(symbol);
+    updateRow(row, { error: item.error });
+    return false;
+  }
+  const price = Number(item.price);
+  const change = (item.change === null || item.change === undefined)
+    ? NaN
+    : Number(item.change);
+  const changePercent = (item.changePercent === null || item.changePercent === undefined)
+    ? NaN
+    : Number(item.changePercent);
+  if (!Number.isFinite(price)) {
+    stockItems.delete(symbol);
+    updateRow(row, { error: "Sin datos" });
+    return false;
+  }
+
+  const updatedAtMs = Number.isFinite(item.updatedAt)
+    ? item.updatedAt * 1000
+    : Date.now();
+  const session = resolveMarketState(item.marketState, updatedAtMs);
+  const updatedAt = new Date(updatedAtMs);
+  const volume = toNumberOrNaN(item.volume);
+  const dayLow = toNumberOrNaN(item.dayLow);
+  const dayHigh = toNumberOrNaN(item.dayHigh);
+  const week52Low = toNumberOrNaN(item.week52Low);
+  const week52High = toNumberOrNaN(item.week52High);
+  const regularPrice = toNumberOrNaN(item.regularPrice);
+  const regularChange = toNumberOrNaN(item.regularChange);
+  const regularChangePercent = toNumberOrNaN(item.regularChangePercent);
+  const extendedPrice = toNumberOrNaN(item.extendedPrice);
+  const extendedChange = toNumberOrNaN(item.extendedChange);
+  const extendedChangePercent = toNumberOrNaN(item.extendedChangePercent);
+  const baselineError = item.baselineError || "";
+
+  stockItems.set(symbol, item);
+  latestStocks.set(symbol, {
+    symbol,
+    price,
+    change,
+    changePercent,
+    session,
+    updatedAt: updatedAtMs,
+    volume,
+    dayLow,
+    dayHigh,
+    week52Low,
+    week52High,
+    regularPrice,
+    regularChange,
+    regularChangePercent,
+    extendedPrice,
+    extendedChange,
+    extendedChangePercent,
+    baselineError,
+  });
+  updateRow(row, {
+    price,
+    change,
+    changePercent,
+    session,
+    volume,
+    dayLow,
+    dayHigh,
+    week52Low,
+    week52High,
+    updatedAt,
+    regularPrice,
+    regularChange,
+    regularChangePercent,
+    extendedPrice,
+    extendedChange,
+    extendedChangePercent,
+    baselineError,
+  });
+  return true;
+}
 
-    STOCKS.forEach((symbol) => {
-      const row = stockRows.get(symbol);
-      const item = mapped.get(symbol);
-      if (!row) return;
-      if (!item) {
-        updateRow(row, { error: "Sin datos" });
-        return;
-      }
-      if (item.error) {
-        updateRow(row, { error: item.error });
-        return;
-      }
-      const price = Number(item.price);
-      const change = (item.change === null || item.change === undefined)
-        ? NaN
-        : Number(item.change);
-      const changePercent = (item.changePercent === null || item.changePercent === undefined)
-        ? NaN
-        : Number(item.changePercent);
-      if (!Number.isFinite(price)) {
-        updateRow(row, { error: "Sin datos" });
-        return;
-      }
+function applyStocksPayload(payload, partial) {
+  const data = Array.isArray(payload.data) ? payload.data : [];
+  const mapped = new Map(data.map((item) => [item.symbol, item]));
+  let pendingCount = 0;
 
-      const updatedAtMs = Number.isFinite(item.updatedAt)
-        ? item.updatedAt * 1000
-        : Date.now();
-      const session = resolveMarketState(item.marketState, updatedAtMs);
-      const updatedAt = new Date(updatedAtMs);
-      const volume = toNumberOrNaN(item.volume);
-      const dayLow = toNumberOrNaN(item.dayLow);
-      const dayHigh = toNumberOrNaN(item.dayHigh);
-      const week52Low = toNumberOrNaN(item.week52Low);
-      const week52High = toNumberOrNaN(item.week52High);
-      const regularPrice = toNumberOrNaN(item.regularPrice);
-      const regularChange = toNumberOrNaN(item.regularChange);
-      const regularChangePercent = toNumberOrNaN(item.regularChangePercent);
-      const extendedPrice = toNumberOrNaN(item.extendedPrice);
-      const extendedChange = toNumberOrNaN(item.extendedChange);
-      const extendedChangePercent = toNumberOrNaN(item.extendedChangePercent);
-      const baselineError = item.baselineError || "";
-
-      latestStocks.set(symbol, {
-        symbol,
-        price,
-        change,
-        changePercent,
-        session,
-        updatedAt: updatedAtMs,
-        volume,
-        dayLow,
-        dayHigh,
-        week52Low,
-        week52High,
-        regularPrice,
-        regularChange,
-        regularChangePercent,
-        extendedPrice,
-        extendedChange,
-        extendedChangePercent,
-        baselineError,
-      });
-      updateRow(row, {
-        price,
-        change,
-        changePercent,
-        session,
-        volume,
-        dayLow,
-        dayHigh,
-        week52Low,
-        week52High,
-        updatedAt,
-        regularPrice,
-        regularChange,
-        regularChangePercent,
-        extendedPrice,
-        extendedChange,
-        extendedChangePercent,
-        baselineError,
-      });
-      okCount += 1;
-    });
+  STOCKS.forEach((symbol) => {
+    const item = mapped.get(symbol);
+    if (!item && partial) return;
+    if (item && item.error === "Pendiente") pendingCount += 1;
+    if (applyStockItem(symbol, item)) {
+      stocksOk.add(symbol);
+    } else {
+      stocksOk.delete(symbol);
+    }
+  });
 
-    setStatus(dom.stockStatus, `Acciones: ${okCount}/${STOCKS.length}`);
-    if (payload.meta && payload.meta.error) {
-      setStatus(
-        dom.stockStatus,
-        `Acciones: ${okCount}/${STOCKS.length} · ${payload.meta.error}`
-      );
+  const okCount = STOCKS.filter((symbol) => stocksOk.has(symbol)).length;
+  setStatus(dom.stockStatus, `Acciones: ${okCount}/${STOCKS.length}`);
+  if (payload.meta && payload.meta.error) {
+    setStatus(
+      dom.stockStatus,
+      `Acciones: ${okCount}/${STOCKS.length} · ${payload.meta.error}`
+    );
+  }
+  dom.lastUpdated.textContent = formatTime(new Date());
+  applyFilter("stocks");
+  evaluateAlerts();
+  return pendingCount;
+}
+
+function applyStocksTouch(payload) {
+  const data = payload && payload.data && typeof payload.data === "object"
+    ? payload.data
+    : {};
+  Object.entries(data).forEach(([symbol, updatedAt]) => {
+    const item = stockItems.get(symbol);
+    if (!item || !Number.isFinite(updatedAt)) return;
+    if (applyStockItem(symbol, { ...item, updatedAt })) {
+      stocksOk.add(symbol);
+    } else {
+      stocksOk.delete(symbol);
     }
-    dom.lastUpdated.textContent = formatTime(new Date());
-    applyFilter("stocks");
-    evaluateAlerts();
+  });
+  dom.lastUpdated.textContent = formatTime(new Date());
+}
+
+function openStockStream() {
+  if (state.stockStreamDisabled || typeof EventSource === "undefined") {
+    return false;
+  }
+  if (state.stockStream) return true;
+  const url = `/api/stream/stocks?symbols=${encodeURIComponent(STOCKS.join(","))}`;
+  const source = new EventSource(url);
+  source.addEventListener("quotes", (event) => {
+    let payload = null;
+    try {
+      payload = JSON.parse(event.data);
+    } catch (error) {
+      return;
+    }
+    applyStocksPayload(payload, true);
+  });
+  source.addEventListener("touch", (event) => {
+    let payload = null;
+    try {
+      payload = JSON.parse(event.data);
+    } catch (error) {
+      return;
+    }
+    applyStocksTouch(payload);
+  });
+  source.addEventListener("error", () => {
+    if (source.readyState === EventSource.CLOSED) {
+      state.stockStream = null;
+      state.stockStreamDisabled = true;
+      updateStocks();
+      return;
+    }
+    setStatus(dom.stockStatus, "Acciones: reconectando...");
+  });
+  state.stockStream = source;
+  setStatus(dom.stockStatus, "Acciones: conectando...");
+  return true;
+}
+
+async function updateStocks() {
+  if (openStockStream()) return;
+  setStatus(dom.stockStatus, "Acciones: actualizando...");
+  try {
+    const payload = await fetchStocksBatch();
+    const pendingCount = applyStocksPayload(payload, false);
+    if (state.stockRetryTimer) clearTimeout(state.stockRetryTimer);
+    state.stockRetryTimer = pendingCount
+      ? setTimeout(updateStocks, STOCK_PENDING_RETRY_MS)
+      : null;
   } catch (error) {
     const message = (error && error.message) ? error.message : "Error API";
     setStatus(dom.stockStatus, `Acciones: ${message}`);
     STOCKS.forEach((symbol) => {
       const row = stockRows.get(symbol);
       if (row) updateRow(row, { error: message });
+      stocksOk.delete(symbol);
     });
   }
 }
@@ -0,0 +1,173 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT_DIR, "scripts", "fixtures", "filings")
+EXPECTED_PATH = os.path.join(FIXTURES_DIR, "expected.json")
+sys.path.insert(0, ROOT_DIR)
+
+import server  # noqa: E402
+
+FIXTURE_FORMS = {
+    "form4_": "4",
+    "form144": "144",
+    "8k_": "8-K",
+    "10k_": "10-K",
+}
+STAGES = {
+    "_safe_parse_xml": "xml_parse",
+    "_parse_form4_text": "fallback",
+    "_parse_form4_html_table": "fallback",
+    "_extract_form4_role": "fallback",
+    "_parse_form144_text": "fallback",
+    "_parse_form144_html_table": "fallback",
+    "_extract_form144_seller_role": "fallback",
+    "_extract_first_tag_value": "fallback",
+    "_extract_first_open_tag_value": "fallback",
+    "_extract_tag_pairs_loose": "fallback",
+    "_strip_html": "strip_html",
+    "_html_text_feed": "html_text",
+}
+STREAM_CHUNK_CHARS = 16384
+
+_stage_totals = {}
+_stage_stack = []
+
+
+def _timed_stage(name, func):
+    def wrapper(*args, **kwargs):
+        _stage_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = _stage_stack.pop()
+            if _stage_stack:
+                _stage_stack[-1] += elapsed
+            _stage_totals[name] = _stage_totals.get(name, 0.0) + elapsed - children
+
+    return wrapper
+
+
+def _install_stage_timers():
+    for attr, stage in STAGES.items():
+        setattr(server, attr, _timed_stage(stage, getattr(server, attr)))
+
+
+def _fixture_form(name):
+    for prefix, form in FIXTURE_FORMS.items():
+        if name.startswith(prefix):
+            return form
+    return ""
+
+
+def _load_fixtures():
+    fixtures = []
+    for name in sorted(os.listdir(FIXTURES_DIR)):
+        form = _fixture_form(name)
+        if not form:
+            continue
+        with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as handle:
+            fixtures.append((name, form, handle.read()))
+    return fixtures
+
+
+def _filing_text(payload):
+    state = {"buffer": "", "skip": "", "words": [], "length": 0, "decoder": None}
+    for start in range(0, len(payload), STREAM_CHUNK_CHARS):
+        if server._html_text_feed(state, payload[start : start + STREAM_CHUNK_CHARS]):
+            break
+    else:
+        server._html_text_feed(state, "", final=True)
+    return " ".join(state["words"])[: server.MAX_FILING_TEXT_CHARS]
+
+
+def _parse_fixture(form, payload):
+    if form == "4":
+        return server._parse_form4_payload(payload)
+    if form == "144":
+        return server._parse_form144_payload(payload)
+    if form == "8-K":
+        return server._parse_8k_payload(_filing_text(payload))
+    return server._parse_10k_payload(_filing_text(payload))
+
+
+def _normalize(result):
+    return json.loads(json.dumps(result, sort_keys=True, default=str))
+
+
+def _peak_memory(form, payload):
+    tracemalloc.start()
+    try:
+        _parse_fixture(form, payload)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de parsers de filings SEC.")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Reescribe expected.json con la salida actual.",
+    )
+    args = parser.parse_args()
+    iterations = max(1, args.iterations)
+    fixtures = _load_fixtures()
+    outputs = {
+        name: _normalize(_parse_fixture(form, payload))
+        for name, form, payload in fixtures
+    }
+    if args.update:
+        with open(EXPECTED_PATH, "w", encoding="utf-8") as handle:
+            json.dump(outputs, handle, ensure_ascii=True, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"expected.json actualizado ({len(outputs)} fixtures).")
+        return 0
+    try:
+        with open(EXPECTED_PATH, "r", encoding="utf-8") as handle:
+            expected = json.load(handle)
+    except FileNotFoundError:
+        print("Falta expected.json; ejecuta con --update.", file=sys.stderr)
+        return 1
+    changed = sorted(
+        name for name in set(outputs) | set(expected)
+        if outputs.get(name) != expected.get(name)
+    )
+    peaks = {name: _peak_memory(form, payload) for name, form, payload in fixtures}
+    _install_stage_timers()
+    print(f"{'fixture':<18}{'KB':>8}{'docs/s':>10}{'ms/doc':>10}{'peak KB':>10}")
+    total_elapsed = 0.0
+    for name, form, payload in fixtures:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            _parse_fixture(form, payload)
+        elapsed = time.perf_counter() - start
+        total_elapsed += elapsed
+        print(
+            f"{name:<18}{len(payload) / 1024:>8.1f}{iterations / elapsed:>10.1f}"
+            f"{elapsed * 1000 / iterations:>10.2f}{peaks[name] / 1024:>10.1f}"
+        )
+    docs = iterations * len(fixtures)
+    print(f"\ntotal: {docs / total_elapsed:.1f} docs/s, pico {max(peaks.values()) / 1024:.1f} KB")
+    print(f"\n{'stage':<18}{'ms/doc':>10}{'%':>8}")
+    for stage, seconds in sorted(_stage_totals.items(), key=lambda entry: -entry[1]):
+        print(
+            f"{stage:<18}{seconds * 1000 / docs:>10.3f}"
+            f"{seconds * 100 / total_elapsed:>8.1f}"
+        )
+    if changed:
+        print(f"\nSalida distinta a expected.json: {', '.join(changed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import server  # noqa: E402
+
+
+def check_press_fallback():
+    original = server._get_news
+    calls = []
+
+    def fake_get_news(symbol, limit=None):
+        calls.append((symbol, limit))
+        return [{"title": "Press release", "link": "https://example.com/pr"}]
+
+    server._get_news = fake_get_news
+    try:
+        tasks = [
+            ("AAA", server._fetch_press_fallback_news, ("AAA", server.NEWS_FETCH_LIMIT))
+        ]
+        [(entries, error)] = server._run_press_tasks(tasks)
+    finally:
+        server._get_news = original
+    assert not error, error
+    assert entries and entries[0]["link"] == "https://example.com/pr", entries
+    assert calls == [("AAA", server.NEWS_FETCH_LIMIT)], calls
+
+
+def check_insider_mixed():
+    result = {
+        "form": "4",
+        "timestamp": 1700000000,
+        "insider_action": "mixto",
+        "event_type": "Compra insider",
+        "shares": 6500,
+        "value_usd": 65000.0,
+        "buy_shares": 6500,
+        "sell_shares": 2000,
+        "buy_value_usd": 65000.0,
+        "sell_value_usd": 21000.0,
+    }
+    window = server._empty_insider_window()
+    server._apply_insider_entry(window, server._insider_entry(result))
+    assert window["buyShares"] == 6500 and window["sellShares"] == 2000, window
+    assert window["netShares"] == 4500, window
+    for key in ("buy_shares", "sell_shares", "buy_value_usd", "sell_value_usd"):
+        result.pop(key)
+    window = server._empty_insider_window()
+    server._apply_insider_entry(window, server._insider_entry(result))
+    assert window["netShares"] == 6500, window
+
+
+def _sleeping_parser(seconds):
+    time.sleep(seconds)
+    return {"slept": seconds}, ""
+
+
+def check_filing_parse_hang():
+    previous_env = os.environ.get("FILING_PARSE_PROCESSES")
+    previous_timeout = server.FILING_PARSE_TIMEOUT_SEC
+    os.environ["FILING_PARSE_PROCESSES"] = "1"
+    server.FILING_PARSE_TIMEOUT_SEC = 0.5
+    try:
+        assert server._parse_filing_payload(_sleeping_parser, 0.3) == (
+            {"slept": 0.3},
+            "",
+        )
+        hung_process = server._filing_parse_idle[0]["process"]
+        start = time.monotonic()
+        parsed, error = server._parse_filing_payload(_sleeping_parser, 30)
+        elapsed = time.monotonic() - start
+        assert parsed is None and error == server.FILING_PARSE_TIMEOUT_ERROR, error
+        assert elapsed < 5, elapsed
+        assert not hung_process.is_alive(), "el worker colgado sigue vivo"
+        assert server._parse_filing_payload(_sleeping_parser, 0) == ({"slept": 0}, "")
+        replacement = server._filing_parse_idle[0]["process"]
+        assert replacement is not hung_process and replacement.is_alive()
+        assert server._filing_parse_workers == 1, server._filing_parse_workers
+    finally:
+        server.FILING_PARSE_TIMEOUT_SEC = previous_timeout
+        if previous_env is None:
+            os.environ.pop("FILING_PARSE_PROCESSES", None)
+        else:
+            os.environ["FILING_PARSE_PROCESSES"] = previous_env
+
+
+CHECKS = {
+    "filing_parse_hang": check_filing_parse_hang,
+    "insider_mixed": check_insider_mixed,
+    "press_fallback": check_press_fallback,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chequeos rapidos de server.py.")
+    parser.add_argument("checks", nargs="*", help=", ".join(sorted(CHECKS)))
+    args = parser.parse_args()
+    names = args.checks or sorted(CHECKS)
+    unknown = [name for name in names if name not in CHECKS]
+    if unknown:
+        parser.error(f"chequeos desconocidos: {', '.join(unknown)}")
+    failed = []
+    for name in names:
+        try:
+            CHECKS[name]()
+        except Exception as exc:
+            failed.append(name)
+            print(f"FALLO {name}: {exc!r}", file=sys.stderr)
+        else:
+            print(f"ok    {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,16 @@
+import codecs
 import gzip
+import http.client
+import io
 import json
+import mmap
+import multiprocessing
 import os
 import re
 import socket
 import threading
 import time
+import zlib
 import urllib.parse
 import urllib.request
 import urllib.error
@@ -14,8 +20,23 @@ from email.utils import parsedate_to_datetime
 from html import unescape
 from zoneinfo import ZoneInfo
 import xml.etree.ElementTree as ET
+from functools import partial
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeout,
+    as_completed,
+    wait,
+)
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    request,
+    send_from_directory,
+    stream_with_context,
+)
 
 DEFAULT_SYMBOLS = [
     "NVDA",
@@ -37,6 +58,58 @@ _credit_log = deque()
 _refresh_lock = threading.Lock()
 _twelve_daily_used = 0
 _twelve_daily_date = None
+_twelve_bucket = {"tokens": float(TWELVE_CREDITS_PER_MINUTE), "time": 0.0}
+_symbol_demand = {}
+DEMAND_HALF_LIFE_SEC = int(os.environ.get("DEMAND_HALF_LIFE_SEC", "600"))
+ALERT_PROXIMITY_PCT = float(os.environ.get("ALERT_PROXIMITY_PCT", "2.0"))
+QUOTE_PROVIDERS = ("nasdaq", "stooq", "twelvedata")
+BREAKER_WINDOW = int(os.environ.get("BREAKER_WINDOW", "20"))
+BREAKER_MIN_SAMPLES = int(os.environ.get("BREAKER_MIN_SAMPLES", "5"))
+BREAKER_ERROR_RATE = float(os.environ.get("BREAKER_ERROR_RATE", "0.5"))
+BREAKER_LATENCY_SEC = float(os.environ.get("BREAKER_LATENCY_SEC", "6"))
+BREAKER_COOLDOWN_SEC = int(os.environ.get("BREAKER_COOLDOWN_SEC", "60"))
+DEFAULT_QUOTE_HEDGE_PERCENTILE = 0.95
+_provider_health = {}
+_provider_health_lock = threading.Lock()
+_hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="quote-hedge")
+DEFAULT_QUOTE_FETCH_WORKERS = 8
+DEFAULT_FILING_FETCH_WORKERS = 8
+FILING_PARSE_TIMEOUT_SEC = float(os.environ.get("FILING_PARSE_TIMEOUT_SEC", "10"))
+FILING_PARSE_START_TIMEOUT_SEC = float(
+    os.environ.get("FILING_PARSE_START_TIMEOUT_SEC", "30")
+)
+FILING_INFLIGHT_WAIT_SEC = float(os.environ.get("FILING_INFLIGHT_WAIT_SEC", "60"))
+INSIDER_WINDOWS_DAYS = (7, 30, 90)
+DEFAULT_QUOTE_REFRESH_INTERVAL_SEC = 60
+WATCHED_SYMBOL_TTL = int(os.environ.get("WATCHED_SYMBOL_TTL", "900"))
+_watched_symbols = {}
+_watch_lock = threading.Lock()
+_quote_refresh_state = {"refreshed": 0, "error": None, "time": 0.0}
+_quote_refresher_thread = None
+_quote_refresher_wake = threading.Event()
+_quote_inflight = {}
+_quote_inflight_lock = threading.Lock()
+COLD_QUOTE_WAIT_SEC = float(os.environ.get("COLD_QUOTE_WAIT_SEC", "10"))
+STREAM_HEARTBEAT_SEC = int(os.environ.get("STREAM_HEARTBEAT_SEC", "15"))
+STREAM_RETRY_MS = int(os.environ.get("STREAM_RETRY_MS", "5000"))
+_quote_seq = 0
+_quote_changed = threading.Condition()
+DEFAULT_HOST_RATE_LIMITS = {
+    "api.nasdaq.com": 12.0,
+    "stooq.com": 12.0,
+    "sec.gov": 10.0,
+}
+_host_rate_next = {}
+_host_rate_lock = threading.Lock()
+DEFAULT_HTTP_POOL_SIZE = 4
+HTTP_POOL_IDLE_SEC = float(os.environ.get("HTTP_POOL_IDLE_SEC", "30"))
+HTTP_MAX_REDIRECTS = 5
+HTTP_REDIRECT_CODES = (301, 302, 303, 307, 308)
+HTTP_ACCEPT_ENCODING = "gzip, deflate"
+HTTP_STREAM_CHUNK = 16384
+_http_pools = {}
+_http_pool_lock = threading.Lock()
+_http_stats = {}
 
 app = Flask(__name__, static_folder=".", static_url_path="")
 TWELVE_DATA_URL = "https://api.twelvedata.com/quote"
@@ -67,6 +140,15 @@ NASDAQ_HEADERS = {
     "Referer": "https://www.nasdaq.com/",
 }
 MARKET_TZ = ZoneInfo("America/New_York")
+NASDAQ_SUMMARY_MAX_TTL = int(os.environ.get("NASDAQ_SUMMARY_MAX_TTL", str(60 * 60 * 12)))
+NASDAQ_SUMMARY_ERROR_TTL = int(os.environ.get("NASDAQ_SUMMARY_ERROR_TTL", "300"))
+MARKET_SESSION_BOUNDARIES = (
+    dt_time(4, 0),
+    dt_time(9, 30),
+    dt_time(16, 0),
+    dt_time(20, 0),
+)
+_nasdaq_summary_cache = {}
 CONFIG_PATH = os.environ.get(
     "CONFIG_PATH", os.path.join(os.path.dirname(__file__), "config.json")
 )
@@ -75,7 +157,23 @@ SEC_SUBMISSION_URL = "https://data.sec.gov/submissions/CIK{cik}.json"
 SEC_CACHE_PATH = os.environ.get(
     "SEC_CACHE_PATH", os.path.join(os.path.dirname(__file__), "sec_tickers.json")
 )
+CIK_INDEX_PATH = os.environ.get(
+    "CIK_INDEX_PATH", os.path.splitext(SEC_CACHE_PATH)[0] + ".idx"
+)
+CIK_INDEX_TICKER_WIDTH = 16
+CIK_INDEX_RECORD_SIZE = CIK_INDEX_TICKER_WIDTH + 10
+CIK_REFRESH_CHECK_SEC = 60 * 15
 SEC_CACHE_TTL = 60 * 60 * 12
+SEC_SUBMISSIONS_TTL = int(os.environ.get("SEC_SUBMISSIONS_TTL", "300"))
+SEC_CURRENT_FEED_URL = (
+    "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type={form}"
+    "&company=&dateb=&owner=include&start={start}&count={count}&output=atom"
+)
+EDGAR_FEED_PAGE_SIZE = 100
+EDGAR_FEED_MAX_PAGES = int(os.environ.get("EDGAR_FEED_MAX_PAGES", "10"))
+EDGAR_FEED_FORMS = ("4", "144", "8-K", "10-K")
+EDGAR_FEED_SEEN_MAX = 5000
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
 CHART_CACHE_TTL = 30
 BASELINE_CACHE_PATH = os.environ.get(
     "BASELINE_CACHE_PATH",
@@ -90,6 +188,7 @@ NEWS_LIMIT = 12
 PRESS_LIMIT = 12
 NEWS_FETCH_LIMIT = max(1, int(os.environ.get("NEWS_FETCH_LIMIT", "30")))
 NEWS_PER_SYMBOL_LIMIT = max(1, int(os.environ.get("NEWS_PER_SYMBOL_LIMIT", "6")))
+NEWS_STORE_MAX = max(NEWS_FETCH_LIMIT, int(os.environ.get("NEWS_STORE_MAX", "100")))
 FILINGS_LIMIT = 12
 FILINGS_PER_SYMBOL_LIMIT = max(
     1, int(os.environ.get("FILINGS_PER_SYMBOL_LIMIT", "6"))
@@ -98,6 +197,8 @@ FILINGS_CACHE_PATH = os.environ.get(
     "FILINGS_CACHE_PATH", os.path.join(os.path.dirname(__file__), "filings_cache.json")
 )
 FILINGS_CACHE_MAX = max(1, int(os.environ.get("FILINGS_CACHE_MAX", "500")))
+FILINGS_LOG_PATH = os.environ.get("FILINGS_LOG_PATH", f"{FILINGS_CACHE_PATH}.log")
+FILINGS_LOG_FLUSH_BATCH = max(1, int(os.environ.get("FILINGS_LOG_FLUSH_BATCH", "25")))
 FILINGS_CACHE_VERSION = "v12"
 TARGET_FILING_FORMS = {
     "8-K",
@@ -110,6 +211,7 @@ TARGET_FILING_FORMS = {
     "144/A",
 }
 STOOQ_URL = "https://stooq.com/q/l/?s={symbol}&f=sd2t2ohlcv&h&e=csv"
+STOOQ_BATCH_SIZE = max(1, int(os.environ.get("STOOQ_BATCH_SIZE", "20")))
 KNOWN_CIKS = {
     "NVDA": "0001045810",
     "MRVL": "0001835632",
@@ -126,10 +228,23 @@ STOOQ_HEADERS = {
     "User-Agent": "Mozilla/5.0",
     "Accept": "text/csv",
 }
-_ticker_cik_cache = {}
-_ticker_cik_loaded_at = 0.0
+_cik_index = None
+_cik_index_lock = threading.Lock()
+_cik_refresher_thread = None
 _filings_cache = {}
-_news_cache = {}
+_submissions_cache = {}
+_submissions_locks = {}
+_submissions_lock = threading.Lock()
+_edgar_watched_ciks = {}
+_edgar_feed_seen = set()
+_edgar_feed_seen_order = deque()
+_edgar_feed_unresolved = {}
+_edgar_feed_state = {"time": 0.0, "error": "", "ingested": 0, "complete": False}
+_edgar_feed_lock = threading.Lock()
+_edgar_feed_thread = None
+_news_store = {}
+_news_store_locks = {}
+_news_store_lock = threading.Lock()
 _press_cache = {}
 _chart_cache = {}
 _translation_cache = {}
@@ -157,9 +272,25 @@ OPENAI_TIMEOUT = 12
 OPENAI_MAX_OUTPUT_TOKENS = 1200
 ANALYSIS_CACHE_TTL = 60 * 60 * 12
 MAX_FILING_TEXT_CHARS = 6000
+HTML_SKIPPED_TAGS = ("script", "style", "head")
+HTML_PENDING_TAG_MAX = 65536
 _analysis_cache = {}
 _filing_text_cache = {}
 _processed_filings_cache = None
+_processed_filings_lock = threading.Lock()
+_processed_filings_pending = []
+_processed_filings_log_lines = 0
+_processed_filings_compacting = False
+_filing_parse_idle = []
+_filing_parse_workers = 0
+_filing_parse_cond = threading.Condition()
+FILING_PARSE_TIMEOUT_ERROR = "Tiempo de procesamiento del filing agotado."
+FILING_PARSE_BROKEN_ERROR = "El proceso de parseo del filing fallo."
+FILING_TRANSIENT_ERRORS = (FILING_PARSE_TIMEOUT_ERROR, FILING_PARSE_BROKEN_ERROR)
+_filing_inflight = {}
+_filing_inflight_lock = threading.Lock()
+_insider_ledger = None
+_insider_ledger_lock = threading.Lock()
 
 
 def load_config():
@@ -189,11 +320,330 @@ def _sec_headers():
     return {"User-Agent": user_agent, "Accept": "application/json"}
 
 
-def _fetch_json(url, headers, timeout=8):
-    request_obj = urllib.request.Request(url, headers=headers)
+def _host_rate_env(host):
+    return os.environ.get(
+        "HOST_RATE_LIMIT_" + re.sub(r"[^A-Z0-9]", "_", host.upper()), ""
+    ).strip()
+
+
+def _host_rate_limit(host):
+    config = load_config()
+    limits = dict(DEFAULT_HOST_RATE_LIMITS)
+    configured = config.get("hostRateLimits")
+    if isinstance(configured, dict):
+        for key, value in configured.items():
+            limits[str(key).lower()] = value
+    bucket = host
+    value = _host_rate_env(host) or limits.get(host)
+    if value is None:
+        for key, candidate in limits.items():
+            if host.endswith(f".{key}"):
+                bucket = key
+                value = _host_rate_env(key) or candidate
+                break
+    try:
+        rate = float(value)
+    except (TypeError, ValueError):
+        return bucket, 0.0
+    return bucket, rate if rate > 0 else 0.0
+
+
+def _throttle_host(url):
+    host = urllib.parse.urlparse(url).netloc.lower()
+    if not host:
+        return
+    bucket, rate = _host_rate_limit(host)
+    if rate <= 0:
+        return
+    interval = 1.0 / rate
+    with _host_rate_lock:
+        now = time.monotonic()
+        slot = max(now, _host_rate_next.get(bucket, 0.0))
+        _host_rate_next[bucket] = slot + interval
+    delay = slot - now
+    if delay > 0:
+        time.sleep(delay)
+
+
+def _quote_fetch_workers():
+    config = load_config()
+    raw = os.environ.get("QUOTE_FETCH_WORKERS", "")
+    if not raw:
+        raw = config.get("quoteFetchWorkers", "")
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        value = DEFAULT_QUOTE_FETCH_WORKERS
+    if value <= 0:
+        value = DEFAULT_QUOTE_FETCH_WORKERS
+    return value
+
+
+def _filing_fetch_workers():
+    config = load_config()
+    raw = os.environ.get("FILING_FETCH_WORKERS", "")
+    if not raw:
+        raw = config.get("filingFetchWorkers", "")
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        value = DEFAULT_FILING_FETCH_WORKERS
+    if value <= 0:
+        value = DEFAULT_FILING_FETCH_WORKERS
+    return value
+
+
+def _map_concurrent(func, items, max_workers):
+    items = list(dict.fromkeys(items))
+    results = {}
+    if not items:
+        return results
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+        for item in items:
+            try:
+                results[item] = func(item)
+            except Exception:
+                results[item] = None
+        return results
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(func, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                results[item] = future.result()
+            except Exception:
+                results[item] = None
+    return results
+
+
+def _http_pool_size(host):
+    config = load_config()
+    sizes = config.get("httpPoolSizes")
+    value = None
+    if isinstance(sizes, dict):
+        value = sizes.get(host)
+    if value is None:
+        value = os.environ.get("HTTP_POOL_SIZE", "") or config.get("httpPoolSize", "")
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        size = DEFAULT_HTTP_POOL_SIZE
+    return max(0, size)
+
+
+def _http_stats_entry(host):
+    entry = _http_stats.get(host)
+    if entry is None:
+        entry = {
+            "requests": 0,
+            "connections": 0,
+            "reused": 0,
+            "redirects": 0,
+            "errors": 0,
+            "bytesWire": 0,
+            "bytesDecoded": 0,
+            "streamsStopped": 0,
+        }
+        _http_stats[host] = entry
+    return entry
+
+
+def _http_count(host, field, amount=1):
+    with _http_pool_lock:
+        _http_stats_entry(host)[field] += amount
+
+
+def _http_acquire(key, timeout):
+    scheme, host, port = key
+    now = time.monotonic()
+    with _http_pool_lock:
+        pool = _http_pools.setdefault(key, deque())
+        while pool:
+            conn, last_used = pool.pop()
+            if (now - last_used) <= HTTP_POOL_IDLE_SEC and conn.sock is not None:
+                conn.timeout = timeout
+                conn.sock.settimeout(timeout)
+                _http_stats_entry(host)["reused"] += 1
+                return conn, True
+            conn.close()
+        _http_stats_entry(host)["connections"] += 1
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout), False
+    return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+
+def _http_release(key, conn):
+    size = _http_pool_size(key[1])
+    with _http_pool_lock:
+        pool = _http_pools.setdefault(key, deque())
+        if len(pool) < size:
+            pool.append((conn, time.monotonic()))
+            return
+    conn.close()
+
+
+def _http_uses_proxy(scheme, host):
+    proxies = urllib.request.getproxies()
+    if scheme not in proxies:
+        return False
+    return not urllib.request.proxy_bypass(host)
+
+
+def _http_send_via_urllib(url, headers, data, timeout, method, consume=None):
+    request_obj = urllib.request.Request(url, data=data, headers=headers, method=method)
     try:
         with urllib.request.urlopen(request_obj, timeout=timeout) as response:
-            payload = response.read().decode("utf-8")
+            if consume is not None and 200 <= response.status < 300:
+                host = (urllib.parse.urlsplit(url).hostname or "").lower()
+                _http_read_stream(host, response, consume)
+                return response.status, response.reason, response.headers, b""
+            return response.status, response.reason, response.headers, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.reason, exc.headers, exc.read()
+
+
+def _http_read_stream(host, response, consume):
+    encoding = (response.headers.get("Content-Encoding") or "").strip().lower()
+    decoder = None
+    if "gzip" in encoding or "deflate" in encoding:
+        decoder = zlib.decompressobj(zlib.MAX_WBITS | 32)
+    while True:
+        chunk = response.read(HTTP_STREAM_CHUNK)
+        if not chunk:
+            if decoder is not None:
+                tail = decoder.flush()
+                if tail:
+                    consume(tail, response.headers)
+            return True
+        _http_count(host, "bytesWire", len(chunk))
+        while chunk:
+            pending = b""
+            if decoder is not None:
+                chunk = decoder.decompress(chunk, HTTP_STREAM_CHUNK)
+                pending = decoder.unconsumed_tail
+            _http_count(host, "bytesDecoded", len(chunk))
+            if chunk and consume(chunk, response.headers):
+                _http_count(host, "streamsStopped")
+                return False
+            chunk = pending
+
+
+def _http_send(url, headers, data, timeout, method, consume=None):
+    parsed = urllib.parse.urlsplit(url)
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    if scheme not in ("http", "https") or not host:
+        raise ValueError(f"URL no soportada: {url}")
+    _http_count(host, "requests")
+    if _http_uses_proxy(scheme, host):
+        return _http_send_via_urllib(url, headers, data, timeout, method, consume)
+    port = parsed.port or (443 if scheme == "https" else 80)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    key = (scheme, host, port)
+    for attempt in range(2):
+        conn, reused = _http_acquire(key, timeout)
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            response = conn.getresponse()
+            complete = True
+            if consume is not None and 200 <= response.status < 300:
+                body = b""
+                complete = _http_read_stream(host, response, consume)
+            else:
+                body = response.read()
+        except (
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ):
+            conn.close()
+            if reused and attempt == 0 and method == "GET":
+                continue
+            _http_count(host, "errors")
+            raise
+        except Exception:
+            conn.close()
+            _http_count(host, "errors")
+            raise
+        if response.will_close or not complete:
+            conn.close()
+        else:
+            _http_release(key, conn)
+        return response.status, response.reason, response.headers, body
+    raise ConnectionError(f"Sin respuesta de {host}")
+
+
+def _decode_content_encoding(body, encoding):
+    encoding = (encoding or "").strip().lower()
+    if not body or not encoding or encoding == "identity":
+        return body
+    if "gzip" in encoding:
+        return gzip.decompress(body)
+    if "deflate" in encoding:
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _http_fetch(url, headers, timeout=8, data=None, with_status=False, consume=None):
+    method = "POST" if data is not None else "GET"
+    headers = dict(headers or {})
+    if not any(key.lower() == "accept-encoding" for key in headers):
+        headers["Accept-Encoding"] = HTTP_ACCEPT_ENCODING
+    for _ in range(HTTP_MAX_REDIRECTS + 1):
+        status, reason, response_headers, body = _http_send(
+            url, headers, data, timeout, method, consume
+        )
+        location = response_headers.get("Location")
+        if status in HTTP_REDIRECT_CODES and location:
+            _http_count(urllib.parse.urlsplit(url).hostname or "", "redirects")
+            url = urllib.parse.urljoin(url, location)
+            if status == 303 or (status in (301, 302) and method == "POST"):
+                method = "GET"
+                data = None
+                headers.pop("Content-Type", None)
+            continue
+        if consume is not None and 200 <= status < 300:
+            if with_status:
+                return status, body, response_headers
+            return body, response_headers
+        host = urllib.parse.urlsplit(url).hostname or ""
+        _http_count(host, "bytesWire", len(body))
+        body = _decode_content_encoding(
+            body, response_headers.get("Content-Encoding", "")
+        )
+        _http_count(host, "bytesDecoded", len(body))
+        if status >= 400:
+            raise urllib.error.HTTPError(
+                url, status, reason, response_headers, io.BytesIO(body)
+            )
+        if with_status:
+            return status, body, response_headers
+        return body, response_headers
+    raise urllib.error.HTTPError(
+        url, status, "Demasiadas redirecciones", response_headers, io.BytesIO(body)
+    )
+
+
+def _http_stats_snapshot():
+    with _http_pool_lock:
+        stats = {host: dict(entry) for host, entry in _http_stats.items()}
+        for (_, host, __), pool in _http_pools.items():
+            if host in stats:
+                stats[host]["idle"] = stats[host].get("idle", 0) + len(pool)
+    return stats
+
+
+def _fetch_json(url, headers, timeout=8):
+    _throttle_host(url)
+    try:
+        body, _ = _http_fetch(url, headers, timeout=timeout)
+        payload = body.decode("utf-8")
     except urllib.error.HTTPError as exc:
         if exc.code == 403 and "sec.gov" in url:
             raise ValueError(
@@ -204,24 +654,14 @@ def _fetch_json(url, headers, timeout=8):
 
 
 def _fetch_text(url, headers, timeout=8):
-    request_obj = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(request_obj, timeout=timeout) as response:
-        return response.read().decode("utf-8")
-
-
-def _read_response_text(response):
-    payload = response.read()
-    encoding = response.headers.get("Content-Encoding", "").lower()
-    if "gzip" in encoding:
-        payload = gzip.decompress(payload)
-    return payload.decode("utf-8")
+    body, _ = _http_fetch(url, headers, timeout=timeout)
+    return body.decode("utf-8")
 
 
 def _fetch_nasdaq_json(url, timeout=8):
-    request_obj = urllib.request.Request(url, headers=NASDAQ_HEADERS)
-    with urllib.request.urlopen(request_obj, timeout=timeout) as response:
-        payload = _read_response_text(response)
-    return json.loads(payload)
+    _throttle_host(url)
+    body, _ = _http_fetch(url, NASDAQ_HEADERS, timeout=timeout)
+    return json.loads(body.decode("utf-8"))
 
 
 def _get_translation_settings():
@@ -322,17 +762,13 @@ def _translate_text_libretranslate(text, settings, url):
     if settings.get("key"):
         payload["api_key"] = settings["key"]
     data = json.dumps(payload).encode("utf-8")
-    request_obj = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            **TRANSLATE_HEADERS,
-            "Content-Type": "application/json",
-        },
-    )
+    headers = {
+        **TRANSLATE_HEADERS,
+        "Content-Type": "application/json",
+    }
     try:
-        with urllib.request.urlopen(request_obj, timeout=TRANSLATE_TIMEOUT) as response:
-            raw = response.read().decode("utf-8")
+        body, _ = _http_fetch(url, headers, timeout=TRANSLATE_TIMEOUT, data=data)
+        raw = body.decode("utf-8")
     except Exception:
         return None
     try:
@@ -369,12 +805,9 @@ def _translate_text_google(text, settings, url):
         }
     )
     request_url = f"{url}?{params}"
-    request_obj = urllib.request.Request(
-        request_url, headers=TRANSLATE_HEADERS
-    )
     try:
-        with urllib.request.urlopen(request_obj, timeout=TRANSLATE_TIMEOUT) as response:
-            raw = response.read().decode("utf-8")
+        body, _ = _http_fetch(request_url, TRANSLATE_HEADERS, timeout=TRANSLATE_TIMEOUT)
+        raw = body.decode("utf-8")
     except Exception:
         return None
     try:
@@ -438,18 +871,14 @@ def _translate_texts_openai(texts, settings, url=None):
         "max_output_tokens": 1000,
     }
     data = json.dumps(payload).encode("utf-8")
-    request_obj = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            **TRANSLATE_HEADERS,
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        },
-    )
+    headers = {
+        **TRANSLATE_HEADERS,
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    }
     try:
-        with urllib.request.urlopen(request_obj, timeout=TRANSLATE_TIMEOUT) as response:
-            raw = response.read().decode("utf-8")
+        body, _ = _http_fetch(url, headers, timeout=TRANSLATE_TIMEOUT, data=data)
+        raw = body.decode("utf-8")
     except Exception:
         return {}
     try:
@@ -648,18 +1077,14 @@ def _get_openai_settings():
 
 def _openai_request(payload, settings):
     data = json.dumps(payload, ensure_ascii=True).encode("utf-8")
-    request_obj = urllib.request.Request(
-        settings["url"],
-        data=data,
-        headers={
-            **TRANSLATE_HEADERS,
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {settings['api_key']}",
-        },
-    )
+    headers = {
+        **TRANSLATE_HEADERS,
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {settings['api_key']}",
+    }
     try:
-        with urllib.request.urlopen(request_obj, timeout=OPENAI_TIMEOUT) as response:
-            raw = response.read().decode("utf-8")
+        body, _ = _http_fetch(settings["url"], headers, timeout=OPENAI_TIMEOUT, data=data)
+        raw = body.decode("utf-8")
     except Exception:
         return None
     try:
@@ -712,6 +1137,89 @@ def _strip_html(value):
     return " ".join(cleaned.split())
 
 
+def _html_text_emit(state, value):
+    for word in unescape(value).split():
+        state["words"].append(word)
+        state["length"] += len(word) + 1
+
+
+def _html_text_feed(state, chunk, final=False):
+    buffer = state["buffer"] + chunk
+    pos = 0
+    while pos < len(buffer) and state["length"] <= MAX_FILING_TEXT_CHARS:
+        if state["skip"]:
+            match = re.compile(rf"(?i)</{state['skip']}\s*>").search(buffer, pos)
+            if match:
+                state["skip"] = ""
+                pos = match.end()
+                continue
+            pos = len(buffer) if final else max(pos, len(buffer) - 32)
+            break
+        start = buffer.find("<", pos)
+        if start == -1:
+            if final:
+                _html_text_emit(state, buffer[pos:])
+                pos = len(buffer)
+            else:
+                cut = max(buffer.rfind(" ", pos), buffer.rfind("\n", pos))
+                if cut >= pos:
+                    _html_text_emit(state, buffer[pos:cut])
+                    pos = cut
+            break
+        _html_text_emit(state, buffer[pos:start])
+        end = buffer.find(">", start)
+        if end == -1:
+            if final or len(buffer) - start > HTML_PENDING_TAG_MAX:
+                _html_text_emit(state, buffer[start : start + 1])
+                pos = start + 1
+                continue
+            pos = start
+            break
+        tag = buffer[start + 1 : end]
+        match = re.match(r"\s*([A-Za-z][A-Za-z0-9]*)", tag)
+        if (
+            match
+            and match.group(1).lower() in HTML_SKIPPED_TAGS
+            and not tag.rstrip().endswith("/")
+        ):
+            state["skip"] = match.group(1).lower()
+        pos = end + 1
+    state["buffer"] = buffer[pos:]
+    return state["length"] > MAX_FILING_TEXT_CHARS
+
+
+def _html_text_consume(state, chunk, headers):
+    if state["decoder"] is None:
+        charset = headers.get_content_charset() or "utf-8"
+        try:
+            state["decoder"] = codecs.getincrementaldecoder(charset)(errors="replace")
+        except LookupError:
+            state["decoder"] = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    return _html_text_feed(state, state["decoder"].decode(chunk))
+
+
+def _stream_filing_text(link):
+    try:
+        headers = _sec_headers()
+    except Exception as exc:
+        error = str(exc) or "No se pudo configurar el User-Agent para SEC."
+        return "", error
+    headers["Accept"] = "text/html,application/xml,text/xml,text/plain"
+    state = {"buffer": "", "skip": "", "words": [], "length": 0, "decoder": None}
+    _throttle_host(link)
+    try:
+        _http_fetch(
+            link, headers, timeout=8, consume=partial(_html_text_consume, state)
+        )
+    except Exception as exc:
+        return "", f"Error descargando el filing: {exc}"
+    if state["length"] <= MAX_FILING_TEXT_CHARS:
+        if state["decoder"] is not None:
+            _html_text_feed(state, state["decoder"].decode(b"", final=True))
+        _html_text_feed(state, "", final=True)
+    return " ".join(state["words"])[:MAX_FILING_TEXT_CHARS], ""
+
+
 def _filing_text_cache_get(link):
     cached = _filing_text_cache.get(link)
     if not cached:
@@ -734,37 +1242,112 @@ def _filing_text_cache_set(link, text, error=""):
 
 
 def _load_processed_filings_cache():
-    global _processed_filings_cache
+    global _processed_filings_cache, _processed_filings_log_lines
     if _processed_filings_cache is not None:
         return _processed_filings_cache
-    try:
-        with open(FILINGS_CACHE_PATH, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        if isinstance(data, dict):
-            _processed_filings_cache = data
-        else:
-            _processed_filings_cache = {}
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        _processed_filings_cache = {}
+    with _processed_filings_lock:
+        if _processed_filings_cache is not None:
+            return _processed_filings_cache
+        cache = {}
+        try:
+            with open(FILINGS_CACHE_PATH, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if isinstance(data, dict):
+                cache = data
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            cache = {}
+        lines = 0
+        try:
+            with open(FILINGS_LOG_PATH, "rb") as handle:
+                raw = handle.read()
+            complete = raw.rfind(b"\n") + 1
+            if complete < len(raw):
+                with open(FILINGS_LOG_PATH, "r+b") as handle:
+                    handle.truncate(complete)
+            for line in raw[:complete].splitlines():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                link = record.get("link")
+                payload = record.get("payload")
+                if link and isinstance(payload, dict):
+                    cache[link] = payload
+                    lines += 1
+        except (FileNotFoundError, OSError):
+            pass
+        _processed_filings_cache = {
+            link: entry
+            for link, entry in cache.items()
+            if isinstance(entry, dict)
+            and entry.get("cacheVersion") == FILINGS_CACHE_VERSION
+        }
+        _processed_filings_log_lines = lines
     return _processed_filings_cache
 
 
-def _save_processed_filings_cache():
-    cache = _load_processed_filings_cache()
-    if len(cache) > FILINGS_CACHE_MAX:
-        items = sorted(
-            cache.items(),
-            key=lambda entry: entry[1].get("processedAt", 0),
-            reverse=True,
-        )[:FILINGS_CACHE_MAX]
-        cache = dict(items)
-        _processed_filings_cache.clear()
-        _processed_filings_cache.update(cache)
+def _append_processed_filings_log():
+    global _processed_filings_log_lines
+    if not _processed_filings_pending:
+        return
+    lines = "".join(
+        json.dumps({"link": link, "payload": payload}, ensure_ascii=True) + "\n"
+        for link, payload in _processed_filings_pending
+    )
     try:
-        with open(FILINGS_CACHE_PATH, "w", encoding="utf-8") as handle:
-            json.dump(cache, handle, ensure_ascii=True)
+        with open(FILINGS_LOG_PATH, "a", encoding="utf-8") as handle:
+            handle.write(lines)
+            handle.flush()
+            os.fsync(handle.fileno())
     except OSError:
         return
+    _processed_filings_log_lines += len(_processed_filings_pending)
+    _processed_filings_pending.clear()
+
+
+def _flush_processed_filings():
+    global _processed_filings_compacting
+    with _processed_filings_lock:
+        _append_processed_filings_log()
+        if (
+            _processed_filings_log_lines < FILINGS_CACHE_MAX
+            or _processed_filings_compacting
+        ):
+            return
+        _processed_filings_compacting = True
+    threading.Thread(target=_compact_processed_filings, daemon=True).start()
+
+
+def _compact_processed_filings():
+    global _processed_filings_log_lines, _processed_filings_compacting
+    try:
+        cache = _load_processed_filings_cache()
+        with _processed_filings_lock:
+            _append_processed_filings_log()
+            if len(cache) > FILINGS_CACHE_MAX:
+                items = sorted(
+                    cache.items(),
+                    key=lambda entry: entry[1].get("processedAt", 0),
+                    reverse=True,
+                )[:FILINGS_CACHE_MAX]
+                cache.clear()
+                cache.update(items)
+            tmp_path = f"{FILINGS_CACHE_PATH}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as handle:
+                    json.dump(cache, handle, ensure_ascii=True)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                os.replace(tmp_path, FILINGS_CACHE_PATH)
+                with open(FILINGS_LOG_PATH, "w", encoding="utf-8"):
+                    pass
+            except OSError:
+                return
+            _processed_filings_log_lines = 0
+    finally:
+        _processed_filings_compacting = False
 
 
 def _load_baseline_cache():
@@ -839,8 +1422,12 @@ def _set_processed_filing(link, payload):
         return
     cache = _load_processed_filings_cache()
     payload["cacheVersion"] = FILINGS_CACHE_VERSION
-    cache[link] = payload
-    _save_processed_filings_cache()
+    with _processed_filings_lock:
+        cache[link] = payload
+        _processed_filings_pending.append((link, payload))
+        if len(_processed_filings_pending) < FILINGS_LOG_FLUSH_BATCH:
+            return
+    _flush_processed_filings()
 
 
 def _fetch_filing_payload(link):
@@ -852,15 +1439,14 @@ def _fetch_filing_payload(link):
         error = str(exc) or "No se pudo configurar el User-Agent para SEC."
         return "", error
     headers["Accept"] = "text/html,application/xml,text/xml,text/plain"
+    _throttle_host(link)
     try:
-        request_obj = urllib.request.Request(link, headers=headers)
-        with urllib.request.urlopen(request_obj, timeout=8) as response:
-            raw = response.read()
-            charset = response.headers.get_content_charset() or "utf-8"
-            try:
-                payload = raw.decode(charset)
-            except (LookupError, UnicodeDecodeError):
-                payload = raw.decode("utf-8", errors="replace")
+        raw, response_headers = _http_fetch(link, headers, timeout=8)
+        charset = response_headers.get_content_charset() or "utf-8"
+        try:
+            payload = raw.decode(charset)
+        except (LookupError, UnicodeDecodeError):
+            payload = raw.decode("utf-8", errors="replace")
     except Exception as exc:
         return "", f"Error descargando el filing: {exc}"
     if not payload:
@@ -874,13 +1460,10 @@ def _fetch_filing_text(link):
     cached = _filing_text_cache_get(link)
     if cached is not None:
         return cached["text"], cached.get("error", "")
-    payload, error = _fetch_filing_payload(link)
+    text, error = _stream_filing_text(link)
     if error:
         _filing_text_cache_set(link, "", error)
         return "", error
-    text = _strip_html(payload)
-    if len(text) > MAX_FILING_TEXT_CHARS:
-        text = text[:MAX_FILING_TEXT_CHARS]
     if not text:
         error = "Documento vacio o no legible."
         _filing_text_cache_set(link, "", error)
@@ -996,8 +1579,8 @@ def _fallback_filing_analysis(item, content):
     date = item.get("date") or ""
     event_type = _infer_event_type(form, content)
     insider_action = _infer_insider_action(form, content)
-    shares = _extract_first_number(r"([0-9][0-9,\\.]+)\\s+shares", content)
-    value = _extract_first_number(r"\\$\\s*([0-9][0-9,\\.]+)", content)
+    shares = _extract_first_number(r"([0-9][0-9,\.]+)\s+shares", content)
+    value = _extract_first_number(r"\$\s*([0-9][0-9,\.]+)", content)
     dilutive = _infer_dilutive(form, content)
     impact = "bajo"
     if event_type in ("M&A", "Financiacion", "Reestructuracion"):
@@ -1082,7 +1665,7 @@ def _sanitize_xml(payload):
 
 
 def _extract_xml_fragment(payload, tag):
-    pattern = rf"(<{tag}\\b[^>]*>.*?</{tag}>)"
+    pattern = rf"(<{tag}\b[^>]*>.*?</{tag}>)"
     match = re.search(pattern, payload, re.IGNORECASE | re.DOTALL)
     if not match:
         return ""
@@ -1090,7 +1673,7 @@ def _extract_xml_fragment(payload, tag):
 
 
 def _extract_tag_value(payload, tag):
-    pattern = rf"<(?:\\w+:)?{tag}\\b[^>]*>(.*?)</(?:\\w+:)?{tag}>"
+    pattern = rf"<(?:\w+:)?{tag}\b[^>]*>(.*?)</(?:\w+:)?{tag}>"
     match = re.search(pattern, payload, re.IGNORECASE | re.DOTALL)
     if not match:
         return ""
@@ -1098,7 +1681,7 @@ def _extract_tag_value(payload, tag):
 
 
 def _extract_open_tag_value(payload, tag):
-    pattern = rf"<(?:\\w+:)?{tag}\\b[^>]*>\\s*([^<]+)"
+    pattern = rf"<(?:\w+:)?{tag}\b[^>]*>\s*([^<]+)"
     match = re.search(pattern, payload, re.IGNORECASE | re.DOTALL)
     if not match:
         return ""
@@ -1123,7 +1706,7 @@ def _extract_first_tag_value(payload, tags):
 
 def _extract_tag_pairs_loose(payload):
     pairs = re.findall(
-        r"<(?:\\w+:)?([A-Za-z0-9_\\-]+)\\b[^>]*>([^<]+)</(?:\\w+:)?\\1>",
+        r"<(?:\w+:)?([A-Za-z0-9_\-]+)\b[^>]*>([^<]+)</(?:\w+:)?\1>",
         payload,
         re.IGNORECASE | re.DOTALL,
     )
@@ -1181,7 +1764,7 @@ def _safe_parse_xml(payload, tag_candidates):
 def _extract_number_from_label(text, labels):
     for label in labels:
         match = re.search(
-            rf"{label}\\s*[:\\-]?\\s*([$0-9,\\.]+)",
+            rf"{label}\s*[:\-]?\s*([$0-9,\.]+)",
             text,
             re.IGNORECASE,
         )
@@ -1233,9 +1816,9 @@ def _parse_form4_text(text):
     if not normalized:
         return None
     action = "desconocido"
-    if re.search(r"Acquired\\s+Disposed\\s+Code\\s*A", normalized, re.IGNORECASE):
+    if re.search(r"Acquired\s+Disposed\s+Code\s*A", normalized, re.IGNORECASE):
         action = "compra"
-    elif re.search(r"Acquired\\s+Disposed\\s+Code\\s*D", normalized, re.IGNORECASE):
+    elif re.search(r"Acquired\s+Disposed\s+Code\s*D", normalized, re.IGNORECASE):
         action = "venta"
     else:
         inferred = _infer_insider_action("4", normalized)
@@ -1342,11 +1925,11 @@ def _extract_form4_role(text):
     if not text:
         return ""
     roles = []
-    if re.search(r"X\\s+Director", text, re.IGNORECASE):
+    if re.search(r"X\s+Director", text, re.IGNORECASE):
         roles.append("Director")
-    if re.search(r"X\\s+Officer", text, re.IGNORECASE):
+    if re.search(r"X\s+Officer", text, re.IGNORECASE):
         roles.append("Ejecutivo")
-    if re.search(r"X\\s+10%\\s+Owner", text, re.IGNORECASE):
+    if re.search(r"X\s+10%\s+Owner", text, re.IGNORECASE):
         roles.append("Accionista 10%")
     return ", ".join(roles)
 
@@ -1365,7 +1948,7 @@ def _extract_form144_seller_role(normalized):
         if "See the definition" in seller:
             seller = seller.split("See the definition", 1)[0].strip()
     role_match = re.search(
-        r"Relationship to Issuer\s*[:\-]?\s*(.+?)(?=Name of Issuer|Title of the Securities|CUSIP|$)",
+        r"Relationship to Issuer\s*[:\-]?\s*(.+?)(?=\(\w\)\s*Address|Address:|Name of Issuer|Title of the Securities|CUSIP|$)",
         normalized,
         re.IGNORECASE,
     )
@@ -1557,6 +2140,10 @@ def _parse_form4_payload(payload):
                 "insider_role": role,
                 "shares": shares,
                 "value_usd": value,
+                "buy_shares": buy_shares,
+                "sell_shares": sell_shares,
+                "buy_value_usd": buy_value if buy_value else None,
+                "sell_value_usd": sell_value if sell_value else None,
                 "price": avg_price,
                 "transaction_type": txn_type,
                 "summary": summary,
@@ -1678,6 +2265,10 @@ def _parse_form4_payload(payload):
         "insider_role": owner_role,
         "shares": shares,
         "value_usd": value,
+        "buy_shares": buy_shares,
+        "sell_shares": sell_shares,
+        "buy_value_usd": buy_value if buy_value else None,
+        "sell_value_usd": sell_value if sell_value else None,
         "price": avg_price,
         "transaction_type": txn_type,
         "summary": summary,
@@ -1789,6 +2380,11 @@ def _parse_form144_payload(payload):
             shares = shares or table_data.get("shares")
             value = value or table_data.get("value")
             date_raw = date_raw or table_data.get("date", "")
+        if not (shares and value):
+            text_parsed = _parse_form144_text(_strip_html(payload))
+            if text_parsed:
+                shares = shares or text_parsed.get("shares")
+                value = value or text_parsed.get("value_usd")
         if not (seller or shares or value or date_raw):
             pairs = _extract_tag_pairs_loose(payload)
             if pairs:
@@ -1908,7 +2504,7 @@ def _parse_form144_payload(payload):
 def _extract_8k_items(text):
     if not text:
         return []
-    matches = re.findall(r"\\bItem\\s+([0-9]{1,2}\\.\\d{2})", text, re.IGNORECASE)
+    matches = re.findall(r"\bItem\s+([0-9]{1,2}\.\d{2})", text, re.IGNORECASE)
     items = []
     for item in matches:
         normalized = item.strip()
@@ -1962,8 +2558,8 @@ def _classify_8k_event(items, text):
 def _parse_8k_payload(text):
     items = _extract_8k_items(text)
     event_type, material, dilutive, impact = _classify_8k_event(items, text)
-    shares = _extract_first_number(r"([0-9][0-9,\\.]+)\\s+shares", text)
-    value = _extract_first_number(r"\\$\\s*([0-9][0-9,\\.]+)", text)
+    shares = _extract_first_number(r"([0-9][0-9,\.]+)\s+shares", text)
+    value = _extract_first_number(r"\$\s*([0-9][0-9,\.]+)", text)
     items_label = ", ".join(items) if items else "N/D"
     summary = f"8-K Items: {items_label}. Evento: {event_type}."
     if material:
@@ -1986,7 +2582,7 @@ def _extract_10k_items(text):
     if not text:
         return []
     matches = re.findall(
-        r"\\bItem\\s+([0-9]{1,2}[A]?)",
+        r"\bItem\s+([0-9]{1,2}[A]?)",
         text,
         re.IGNORECASE,
     )
@@ -2016,11 +2612,139 @@ def _parse_10k_payload(text):
     }, ""
 
 
+def _filing_parse_processes():
+    config = load_config()
+    raw = os.environ.get("FILING_PARSE_PROCESSES", "")
+    if not raw:
+        raw = config.get("filingParseProcesses", "")
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        value = 0
+    return max(0, value)
+
+
+def _filing_parse_worker(conn):
+    while True:
+        try:
+            parser, payload = conn.recv()
+            conn.send(None)
+        except (EOFError, OSError):
+            return
+        try:
+            response = (True, parser(payload))
+        except Exception as exc:
+            response = (False, exc)
+        try:
+            conn.send(response)
+        except (EOFError, OSError):
+            return
+
+
+def _spawn_filing_parse_worker():
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe()
+    process = context.Process(
+        target=_filing_parse_worker, args=(child_conn,), daemon=True
+    )
+    process.start()
+    child_conn.close()
+    return {"process": process, "conn": parent_conn}
+
+
+def _acquire_filing_parse_worker(processes):
+    global _filing_parse_workers
+    with _filing_parse_cond:
+        while not _filing_parse_idle and _filing_parse_workers >= processes:
+            _filing_parse_cond.wait()
+        if _filing_parse_idle:
+            return _filing_parse_idle.pop()
+        _filing_parse_workers += 1
+    try:
+        return _spawn_filing_parse_worker()
+    except Exception:
+        _discard_filing_parse_worker(None)
+        raise
+
+
+def _release_filing_parse_worker(worker):
+    with _filing_parse_cond:
+        _filing_parse_idle.append(worker)
+        _filing_parse_cond.notify()
+
+
+def _discard_filing_parse_worker(worker):
+    global _filing_parse_workers
+    if worker is not None:
+        try:
+            worker["conn"].close()
+        except OSError:
+            pass
+        worker["process"].terminate()
+        worker["process"].join(1)
+        if worker["process"].is_alive():
+            worker["process"].kill()
+            worker["process"].join(1)
+    with _filing_parse_cond:
+        _filing_parse_workers -= 1
+        _filing_parse_cond.notify()
+
+
+def _parse_filing_payload(parser, payload):
+    processes = _filing_parse_processes()
+    if processes <= 0:
+        return parser(payload)
+    try:
+        worker = _acquire_filing_parse_worker(processes)
+    except Exception:
+        return parser(payload)
+    try:
+        worker["conn"].send((parser, payload))
+        if not worker["conn"].poll(FILING_PARSE_START_TIMEOUT_SEC):
+            raise EOFError
+        worker["conn"].recv()
+        if not worker["conn"].poll(FILING_PARSE_TIMEOUT_SEC):
+            _discard_filing_parse_worker(worker)
+            return None, FILING_PARSE_TIMEOUT_ERROR
+        ok, response = worker["conn"].recv()
+    except Exception:
+        _discard_filing_parse_worker(worker)
+        return None, FILING_PARSE_BROKEN_ERROR
+    _release_filing_parse_worker(worker)
+    if not ok:
+        raise response
+    return response
+
+
 def _process_filing_item(item):
     link = item.get("link") or ""
     cached = _get_processed_filing(link)
     if cached and (cached.get("event_type") or cached.get("documentError")):
         return cached
+    if not link:
+        return _run_filing_item(item)
+    with _filing_inflight_lock:
+        job = _filing_inflight.get(link)
+        owner = job is None
+        if owner:
+            job = {"event": threading.Event(), "result": None}
+            _filing_inflight[link] = job
+    if not owner:
+        job["event"].wait(FILING_INFLIGHT_WAIT_SEC)
+        if job["result"] is not None:
+            return job["result"]
+        return _run_filing_item(item)
+    try:
+        job["result"] = _run_filing_item(item)
+        return job["result"]
+    finally:
+        with _filing_inflight_lock:
+            _filing_inflight.pop(link, None)
+        job["event"].set()
+
+
+def _run_filing_item(item):
+    link = item.get("link") or ""
     symbol = item.get("symbol") or item.get("ticker") or ""
     form = (item.get("form") or item.get("form_type") or "").strip().upper()
     date = item.get("date") or ""
@@ -2049,11 +2773,11 @@ def _process_filing_item(item):
     if form.startswith("4"):
         payload, error = _fetch_filing_payload(link)
         if not error:
-            parsed, error = _parse_form4_payload(payload)
+            parsed, error = _parse_filing_payload(_parse_form4_payload, payload)
     elif form.startswith("144"):
         payload, error = _fetch_filing_payload(link)
         if not error:
-            parsed, error = _parse_form144_payload(payload)
+            parsed, error = _parse_filing_payload(_parse_form144_payload, payload)
     elif form.startswith("8-K"):
         text, error = _fetch_filing_text(link)
         if not error:
@@ -2079,15 +2803,189 @@ def _process_filing_item(item):
         result["value"] = parsed.get("value_usd")
     result["timestamp"] = _parse_iso_date(date) or 0
     result["processedAt"] = time.time()
-    _set_processed_filing(link, result)
+    if error not in FILING_TRANSIENT_ERRORS:
+        _set_processed_filing(link, result)
+    _record_insider_activity(result)
     return result
 
 
+def _insider_entry(result):
+    form = (result.get("form") or result.get("form_type") or "").upper()
+    if not (form.startswith("4") or form.startswith("144")):
+        return None
+    if result.get("documentError"):
+        return None
+    timestamp = result.get("timestamp") or 0
+    shares = _to_float(result.get("shares")) or 0.0
+    value = _to_float(result.get("value_usd")) or 0.0
+    if not timestamp or not (shares or value):
+        return None
+    action = result.get("insider_action") or result.get("insiderAction") or ""
+    role = result.get("insider_role") or result.get("insiderRole") or ""
+    buy_shares = _to_float(result.get("buy_shares"))
+    sell_shares = _to_float(result.get("sell_shares"))
+    if form.startswith("144"):
+        kind = "proposed"
+    elif action == "mixto" and buy_shares is not None and sell_shares is not None:
+        return {
+            "timestamp": timestamp,
+            "kind": "mixed",
+            "shares": buy_shares,
+            "value": _to_float(result.get("buy_value_usd")) or 0.0,
+            "sellShares": sell_shares,
+            "sellValue": _to_float(result.get("sell_value_usd")) or 0.0,
+            "role": role,
+        }
+    elif action == "compra":
+        kind = "buy"
+    elif action == "mixto":
+        event_type = result.get("event_type") or result.get("eventType") or ""
+        kind = "buy" if event_type == "Compra insider" else "sell"
+    elif action == "venta":
+        kind = "sell"
+    else:
+        return None
+    return {
+        "timestamp": timestamp,
+        "kind": kind,
+        "shares": shares,
+        "value": value,
+        "role": role,
+    }
+
+
+def _empty_insider_window():
+    return {
+        "filings": 0,
+        "buyShares": 0.0,
+        "sellShares": 0.0,
+        "netShares": 0.0,
+        "buyValue": 0.0,
+        "sellValue": 0.0,
+        "netValue": 0.0,
+        "proposedSaleShares": 0.0,
+        "proposedSaleValue": 0.0,
+    }
+
+
+def _apply_insider_entry(window, entry, sign=1):
+    window["filings"] += sign
+    if entry["kind"] in ("buy", "mixed"):
+        window["buyShares"] += sign * entry["shares"]
+        window["buyValue"] += sign * entry["value"]
+        if entry["kind"] == "mixed":
+            window["sellShares"] += sign * entry["sellShares"]
+            window["sellValue"] += sign * entry["sellValue"]
+    elif entry["kind"] == "sell":
+        window["sellShares"] += sign * entry["shares"]
+        window["sellValue"] += sign * entry["value"]
+    else:
+        window["proposedSaleShares"] += sign * entry["shares"]
+        window["proposedSaleValue"] += sign * entry["value"]
+    window["netShares"] = window["buyShares"] - window["sellShares"]
+    window["netValue"] = window["buyValue"] - window["sellValue"]
+
+
+def _rebuild_insider_windows(ledger_entry, now):
+    windows = {}
+    expires_at = float("inf")
+    for days in INSIDER_WINDOWS_DAYS:
+        span = days * 86400
+        window = _empty_insider_window()
+        for entry in ledger_entry["entries"].values():
+            if entry["timestamp"] > now - span:
+                _apply_insider_entry(window, entry)
+                expires_at = min(expires_at, entry["timestamp"] + span)
+        windows[f"{days}d"] = window
+    ledger_entry["windows"] = windows
+    ledger_entry["expiresAt"] = expires_at
+
+
+def _insider_ledger_symbol(ledger, symbol):
+    ledger_entry = ledger.get(symbol)
+    if ledger_entry is None:
+        ledger_entry = {"entries": {}, "windows": {}, "expiresAt": 0.0}
+        _rebuild_insider_windows(ledger_entry, time.time())
+        ledger[symbol] = ledger_entry
+    return ledger_entry
+
+
+def _add_insider_entry(ledger, symbol, link, entry, now):
+    ledger_entry = _insider_ledger_symbol(ledger, symbol)
+    previous = ledger_entry["entries"].get(link)
+    ledger_entry["entries"][link] = entry
+    if now >= ledger_entry["expiresAt"]:
+        _rebuild_insider_windows(ledger_entry, now)
+        return
+    for days in INSIDER_WINDOWS_DAYS:
+        span = days * 86400
+        window = ledger_entry["windows"][f"{days}d"]
+        if previous and previous["timestamp"] > now - span:
+            _apply_insider_entry(window, previous, -1)
+        if entry["timestamp"] > now - span:
+            _apply_insider_entry(window, entry)
+            ledger_entry["expiresAt"] = min(
+                ledger_entry["expiresAt"], entry["timestamp"] + span
+            )
+
+
+def _load_insider_ledger():
+    global _insider_ledger
+    if _insider_ledger is not None:
+        return _insider_ledger
+    cache = _load_processed_filings_cache()
+    with _insider_ledger_lock:
+        if _insider_ledger is not None:
+            return _insider_ledger
+        ledger = {}
+        now = time.time()
+        for link, result in list(cache.items()):
+            entry = _insider_entry(result)
+            symbol = (result.get("symbol") or "").upper()
+            if entry and symbol:
+                _add_insider_entry(ledger, symbol, link, entry, now)
+        _insider_ledger = ledger
+    return _insider_ledger
+
+
+def _record_insider_activity(result):
+    entry = _insider_entry(result)
+    symbol = (result.get("symbol") or "").upper()
+    link = result.get("link") or ""
+    if not entry or not symbol or not link:
+        return
+    ledger = _load_insider_ledger()
+    with _insider_ledger_lock:
+        _add_insider_entry(ledger, symbol, link, entry, time.time())
+
+
+def _get_insider_summary(symbol):
+    symbol = symbol.upper()
+    ledger = _load_insider_ledger()
+    now = time.time()
+    with _insider_ledger_lock:
+        ledger_entry = _insider_ledger_symbol(ledger, symbol)
+        if now >= ledger_entry["expiresAt"]:
+            _rebuild_insider_windows(ledger_entry, now)
+        return {
+            "symbol": symbol,
+            "windows": {
+                name: dict(window) for name, window in ledger_entry["windows"].items()
+            },
+            "filings": len(ledger_entry["entries"]),
+        }
+
+
 def _process_filings(items):
-    processed = []
-    for item in items:
-        processed.append(_process_filing_item(item))
-    return processed
+    items = list(items)
+    workers = max(1, min(_filing_fetch_workers(), len(items)))
+    try:
+        if workers == 1:
+            return [_process_filing_item(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_process_filing_item, items))
+    finally:
+        _flush_processed_filings()
 
 
 def _apply_news_analysis(items):
@@ -2187,64 +3085,408 @@ def _load_cik_cache():
             data = json.load(handle)
         if isinstance(data, dict):
             return data
-    except (FileNotFoundError, json.JSONDecodeError):
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
         return {}
     return {}
 
 
 def _save_cik_cache(data):
+    tmp_path = f"{SEC_CACHE_PATH}.tmp"
     try:
-        with open(SEC_CACHE_PATH, "w", encoding="utf-8") as handle:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
             json.dump(data, handle)
+        os.replace(tmp_path, SEC_CACHE_PATH)
     except OSError:
         pass
 
 
-def _get_cik_map():
-    global _ticker_cik_cache, _ticker_cik_loaded_at
-    now = time.time()
-    if _ticker_cik_cache and (now - _ticker_cik_loaded_at) < SEC_CACHE_TTL:
-        return _ticker_cik_cache
-    cached = _load_cik_cache()
-    if cached:
-        _ticker_cik_cache = cached
-        _ticker_cik_loaded_at = now
-        return _ticker_cik_cache
+def _write_cik_index(mapping):
+    records = []
+    for ticker, cik in mapping.items():
+        key = str(ticker).strip().upper().encode("ascii", errors="ignore")
+        value = str(cik).strip().zfill(10).encode("ascii", errors="ignore")
+        if not key or len(key) > CIK_INDEX_TICKER_WIDTH or len(value) != 10:
+            continue
+        records.append(key.ljust(CIK_INDEX_TICKER_WIDTH) + value)
+    records.sort()
+    tmp_path = f"{CIK_INDEX_PATH}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(b"".join(records))
+    os.replace(tmp_path, CIK_INDEX_PATH)
+
+
+def _open_cik_index():
+    with open(CIK_INDEX_PATH, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if not size or size % CIK_INDEX_RECORD_SIZE:
+            return None
+        view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return {
+        "view": view,
+        "count": size // CIK_INDEX_RECORD_SIZE,
+        "builtAt": os.path.getmtime(CIK_INDEX_PATH),
+    }
+
+
+def _load_cik_index():
+    global _cik_index
+    if _cik_index is not None:
+        return _cik_index
+    with _cik_index_lock:
+        if _cik_index is not None:
+            return _cik_index
+        index = None
+        try:
+            stale = os.path.getmtime(CIK_INDEX_PATH) < os.path.getmtime(SEC_CACHE_PATH)
+        except OSError:
+            stale = True
+        if stale:
+            mapping = _load_cik_cache()
+            if mapping:
+                try:
+                    _write_cik_index(mapping)
+                except OSError:
+                    pass
+        try:
+            index = _open_cik_index()
+        except (OSError, ValueError):
+            index = None
+        _cik_index = index or {"view": b"", "count": 0, "builtAt": 0.0}
+    _ensure_cik_refresher()
+    return _cik_index
+
+
+def _lookup_cik(symbol):
+    symbol = str(symbol or "").strip().upper()
+    key = symbol.encode("ascii", errors="ignore")
+    index = _load_cik_index()
+    if key and len(key) <= CIK_INDEX_TICKER_WIDTH:
+        key = key.ljust(CIK_INDEX_TICKER_WIDTH)
+        view = index["view"]
+        low, high = 0, index["count"]
+        while low < high:
+            mid = (low + high) // 2
+            offset = mid * CIK_INDEX_RECORD_SIZE
+            current = view[offset : offset + CIK_INDEX_TICKER_WIDTH]
+            if current < key:
+                low = mid + 1
+            elif current > key:
+                high = mid
+            else:
+                start = offset + CIK_INDEX_TICKER_WIDTH
+                return view[start : start + 10].decode("ascii")
+    return KNOWN_CIKS.get(symbol, "")
+
 
+def _refresh_cik_index():
+    global _cik_index
+    data = _fetch_json(SEC_TICKER_URL, _sec_headers())
     mapping = dict(KNOWN_CIKS)
-    try:
-        data = _fetch_json(SEC_TICKER_URL, _sec_headers())
-        if isinstance(data, dict):
-            for _, item in data.items():
-                if not isinstance(item, dict):
-                    continue
-                ticker = item.get("ticker")
-                cik = item.get("cik_str")
-                if ticker and cik is not None:
-                    mapping[str(ticker).upper()] = str(cik).zfill(10)
-    except Exception:
-        pass
+    if isinstance(data, dict):
+        for _, item in data.items():
+            if not isinstance(item, dict):
+                continue
+            ticker = item.get("ticker")
+            cik = item.get("cik_str")
+            if ticker and cik is not None:
+                mapping[str(ticker).upper()] = str(cik).zfill(10)
+    if len(mapping) <= len(KNOWN_CIKS):
+        return
+    _save_cik_cache(mapping)
+    _write_cik_index(mapping)
+    index = _open_cik_index()
+    if index:
+        _cik_index = index
 
-    if mapping:
-        _ticker_cik_cache = mapping
-        _ticker_cik_loaded_at = now
-        _save_cik_cache(mapping)
-    return mapping
 
+def _cik_refresher_loop():
+    while True:
+        index = _load_cik_index()
+        if (time.time() - index["builtAt"]) >= SEC_CACHE_TTL:
+            try:
+                _refresh_cik_index()
+            except Exception:
+                pass
+        time.sleep(CIK_REFRESH_CHECK_SEC)
 
-def _get_filings(symbol):
-    symbol = symbol.upper()
-    cached = _filings_cache.get(symbol)
-    if cached and (time.time() - cached["time"]) < SEC_CACHE_TTL:
-        return cached["data"]
 
-    cik_map = _get_cik_map()
-    cik = cik_map.get(symbol)
-    if not cik:
-        raise ValueError("No hay CIK para este symbol")
+def _ensure_cik_refresher():
+    global _cik_refresher_thread
+    if _cik_refresher_thread is not None and _cik_refresher_thread.is_alive():
+        return
+    with _cik_index_lock:
+        if _cik_refresher_thread is not None and _cik_refresher_thread.is_alive():
+            return
+        _cik_refresher_thread = threading.Thread(
+            target=_cik_refresher_loop,
+            name="cik-refresher",
+            daemon=True,
+        )
+        _cik_refresher_thread.start()
 
-    url = SEC_SUBMISSION_URL.format(cik=cik)
-    data = _fetch_json(url, _sec_headers())
+
+def _submissions_ttl():
+    interval = _edgar_feed_interval_sec()
+    if interval <= 0 or _edgar_feed_state["error"]:
+        return SEC_SUBMISSIONS_TTL
+    if not _edgar_feed_state["complete"]:
+        return SEC_SUBMISSIONS_TTL
+    if (time.time() - _edgar_feed_state["time"]) > interval * 3:
+        return SEC_SUBMISSIONS_TTL
+    return max(SEC_SUBMISSIONS_TTL, SEC_CACHE_TTL)
+
+
+def _get_submissions(cik, force=False):
+    ttl = _submissions_ttl()
+    cached = _submissions_cache.get(cik)
+    if not force and cached and (time.time() - cached["time"]) < ttl:
+        return cached["data"]
+    with _submissions_lock:
+        lock = _submissions_locks.setdefault(cik, threading.Lock())
+    with lock:
+        cached = _submissions_cache.get(cik)
+        if not force and cached and (time.time() - cached["time"]) < ttl:
+            return cached["data"]
+        headers = _sec_headers()
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("lastModified"):
+                headers["If-Modified-Since"] = cached["lastModified"]
+        url = SEC_SUBMISSION_URL.format(cik=cik)
+        _throttle_host(url)
+        try:
+            status, body, response_headers = _http_fetch(
+                url, headers, with_status=True
+            )
+        except urllib.error.HTTPError as exc:
+            if exc.code == 403:
+                raise ValueError(
+                    "SEC 403: configura secUserAgent en config.json con un contacto real."
+                ) from exc
+            raise
+        if status == 304 and cached:
+            cached["time"] = time.time()
+            return cached["data"]
+        data = json.loads(body.decode("utf-8"))
+        _submissions_cache[cik] = {
+            "time": time.time(),
+            "data": data,
+            "etag": response_headers.get("ETag") or "",
+            "lastModified": response_headers.get("Last-Modified") or "",
+        }
+        return data
+
+
+def _filing_item_link(cik, accession, primary):
+    accession_no = accession.replace("-", "")
+    base = f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{accession_no}"
+    return f"{base}/{primary}" if primary else f"{base}/{accession}-index.html"
+
+
+def _edgar_feed_interval_sec():
+    config = load_config()
+    raw = os.environ.get("EDGAR_FEED_INTERVAL_SEC", "")
+    if not raw:
+        raw = config.get("edgarFeedIntervalSec", "")
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        value = 0
+    return max(0, value)
+
+
+def _edgar_watch_symbol(symbol, cik):
+    if _edgar_feed_interval_sec() <= 0:
+        return
+    with _edgar_feed_lock:
+        _edgar_watched_ciks.setdefault(cik, set()).add(symbol)
+    _ensure_edgar_feed()
+
+
+def _parse_edgar_feed(payload):
+    root = ET.fromstring(payload)
+    entries = []
+    for entry in root.iter(f"{ATOM_NS}entry"):
+        title = entry.findtext(f"{ATOM_NS}title") or ""
+        entry_id = entry.findtext(f"{ATOM_NS}id") or ""
+        category = entry.find(f"{ATOM_NS}category")
+        form = category.get("term", "") if category is not None else ""
+        if not form:
+            form = title.split(" - ", 1)[0]
+        cik_match = re.search(r"\((\d{10})\)", title)
+        accession_match = re.search(r"accession-number=([0-9-]+)", entry_id)
+        if not cik_match or not accession_match:
+            continue
+        entries.append(
+            {
+                "cik": cik_match.group(1),
+                "accession": accession_match.group(1),
+                "form": form.strip().upper(),
+            }
+        )
+    return entries
+
+
+def _edgar_mark_seen(entry):
+    key = (entry["cik"], entry["accession"])
+    if key in _edgar_feed_seen:
+        return False
+    _edgar_feed_seen.add(key)
+    _edgar_feed_seen_order.append(key)
+    while len(_edgar_feed_seen_order) > EDGAR_FEED_SEEN_MAX:
+        _edgar_feed_seen.discard(_edgar_feed_seen_order.popleft())
+    return True
+
+
+def _ingest_edgar_filings(cik, accessions):
+    data = _get_submissions(cik, force=True)
+    filings = data.get("filings", {}).get("recent", {})
+    accession_numbers = filings.get("accessionNumber", [])
+    forms = filings.get("form", [])
+    dates = filings.get("filingDate", [])
+    primary_docs = filings.get("primaryDocument", [])
+    with _edgar_feed_lock:
+        symbols = sorted(_edgar_watched_ciks.get(cik, ()))
+    items = []
+    unresolved = set(accessions)
+    for idx, accession in enumerate(accession_numbers):
+        if accession not in accessions:
+            continue
+        unresolved.discard(accession)
+        form = forms[idx] if idx < len(forms) else ""
+        if not _is_target_filing_form(form):
+            continue
+        date = dates[idx] if idx < len(dates) else ""
+        primary = primary_docs[idx] if idx < len(primary_docs) else ""
+        for symbol in symbols:
+            items.append(
+                {
+                    "symbol": symbol,
+                    "form": form,
+                    "date": date,
+                    "link": _filing_item_link(cik, accession, primary),
+                }
+            )
+    if items:
+        for symbol in symbols:
+            _filings_cache.pop(symbol, None)
+        _process_filings(items)
+    return len(items), unresolved
+
+
+def _poll_edgar_form(form, headers, watched, pending):
+    polled = set()
+    for page in range(max(1, EDGAR_FEED_MAX_PAGES)):
+        url = SEC_CURRENT_FEED_URL.format(
+            form=urllib.parse.quote(form),
+            start=page * EDGAR_FEED_PAGE_SIZE,
+            count=EDGAR_FEED_PAGE_SIZE,
+        )
+        _throttle_host(url)
+        body, _ = _http_fetch(url, headers, timeout=8)
+        entries = _parse_edgar_feed(body.decode("utf-8", errors="replace"))
+        reached_seen = False
+        for entry in entries:
+            key = (entry["cik"], entry["accession"])
+            if key in polled:
+                continue
+            polled.add(key)
+            if not _edgar_mark_seen(entry):
+                reached_seen = True
+                continue
+            if entry["cik"] in watched and _is_target_filing_form(entry["form"]):
+                pending.setdefault(entry["cik"], set()).add(entry["accession"])
+        if reached_seen or len(entries) < EDGAR_FEED_PAGE_SIZE:
+            return True
+    return False
+
+
+def _poll_edgar_feed():
+    headers = _sec_headers()
+    headers["Accept"] = "application/atom+xml,application/xml,text/xml"
+    with _edgar_feed_lock:
+        watched = set(_edgar_watched_ciks)
+    primed = bool(_edgar_feed_seen)
+    pending = {}
+    complete = primed
+    for form in EDGAR_FEED_FORMS:
+        if not _poll_edgar_form(form, headers, watched, pending):
+            complete = False
+    now = time.time()
+    for cik, accessions in _edgar_feed_unresolved.items():
+        for accession, first_seen in accessions.items():
+            if cik in watched and (now - first_seen) < SEC_CACHE_TTL:
+                pending.setdefault(cik, set()).add(accession)
+    unresolved = {}
+    ingested = 0
+    for cik, accessions in pending.items():
+        previous = _edgar_feed_unresolved.get(cik, {})
+        try:
+            count, missing = _ingest_edgar_filings(cik, accessions)
+        except Exception:
+            count, missing = 0, accessions
+        ingested += count
+        if missing:
+            unresolved[cik] = {
+                accession: previous.get(accession, now) for accession in missing
+            }
+    _edgar_feed_unresolved.clear()
+    _edgar_feed_unresolved.update(unresolved)
+    if unresolved:
+        complete = False
+    return ingested, complete
+
+
+def _edgar_feed_loop():
+    while True:
+        interval = _edgar_feed_interval_sec()
+        if interval <= 0:
+            time.sleep(60)
+            continue
+        try:
+            ingested, complete = _poll_edgar_feed()
+            _edgar_feed_state.update(
+                {
+                    "time": time.time(),
+                    "error": "",
+                    "ingested": _edgar_feed_state["ingested"] + ingested,
+                    "complete": complete,
+                }
+            )
+        except Exception as exc:
+            _edgar_feed_state["error"] = str(exc) or "Error EDGAR feed"
+            _edgar_feed_state["complete"] = False
+        time.sleep(interval)
+
+
+def _ensure_edgar_feed():
+    global _edgar_feed_thread
+    if _edgar_feed_thread is not None and _edgar_feed_thread.is_alive():
+        return
+    with _edgar_feed_lock:
+        if _edgar_feed_thread is not None and _edgar_feed_thread.is_alive():
+            return
+        _edgar_feed_thread = threading.Thread(
+            target=_edgar_feed_loop,
+            name="edgar-feed",
+            daemon=True,
+        )
+        _edgar_feed_thread.start()
+
+
+def _get_filings(symbol):
+    symbol = symbol.upper()
+    cached = _filings_cache.get(symbol)
+    if cached and (time.time() - cached["time"]) < SEC_CACHE_TTL:
+        return cached["data"]
+
+    cik = _lookup_cik(symbol)
+    if not cik:
+        raise ValueError("No hay CIK para este symbol")
+
+    _edgar_watch_symbol(symbol, cik)
+    data = _get_submissions(cik)
     filings = data.get("filings", {}).get("recent", {})
     accession_numbers = filings.get("accessionNumber", [])
     forms = filings.get("form", [])
@@ -2259,9 +3501,7 @@ def _get_filings(symbol):
             continue
         date = dates[idx] if idx < len(dates) else ""
         primary = primary_docs[idx] if idx < len(primary_docs) else ""
-        accession_no = accession.replace("-", "")
-        base = f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{accession_no}"
-        link = f"{base}/{primary}" if primary else f"{base}/{accession}-index.html"
+        link = _filing_item_link(cik, accession, primary)
         items.append(
             {
                 "symbol": symbol,
@@ -2277,30 +3517,79 @@ def _get_filings(symbol):
     return processed
 
 
-def _get_news(symbol, limit=None):
-    symbol = symbol.upper()
-    cached = _news_cache.get(symbol)
-    if cached and (time.time() - cached["time"]) < NEWS_CACHE_TTL:
-        items = cached["data"]
-        if limit is None:
-            limit = NEWS_PER_SYMBOL_LIMIT
-        return items[:limit] if limit else []
-
+def _fetch_news_feed(symbol):
     url = NEWS_FEED_URL.format(symbol=urllib.parse.quote(symbol))
-    payload = _fetch_text(url, NEWS_HEADERS)
-    root = ET.fromstring(payload)
     items = []
-    for item in root.findall(".//item")[:NEWS_FETCH_LIMIT]:
-        title = item.findtext("title") or ""
-        link = item.findtext("link") or ""
-        date = item.findtext("pubDate") or ""
-        source = item.findtext("source") or ""
-        items.append({"title": title, "link": link, "date": date, "source": source})
-
-    _news_cache[symbol] = {"time": time.time(), "data": items}
+    for entry in _poll_feed(url, NEWS_HEADERS, 8)[:NEWS_FETCH_LIMIT]:
+        item = dict(entry)
+        item["timestamp"] = _parse_rss_date(item["date"]) or 0
+        items.append(item)
+    return items
+
+
+def _merge_news_items(entry, items):
+    merged = list(entry["items"])
+    added = 0
+    for item in items:
+        guid = item.get("guid")
+        if not guid or guid in entry["guids"]:
+            continue
+        entry["guids"].add(guid)
+        merged.append(item)
+        added += 1
+    if added:
+        merged = sorted(
+            merged, key=lambda item: item.get("timestamp") or 0, reverse=True
+        )
+        for item in merged[NEWS_STORE_MAX:]:
+            entry["guids"].discard(item.get("guid"))
+        entry["items"] = merged[:NEWS_STORE_MAX]
+    return added
+
+
+def _get_news_items(symbol):
+    symbol = symbol.upper()
+    entry = _news_store.get(symbol)
+    if entry and (time.time() - entry["time"]) < NEWS_CACHE_TTL:
+        return list(entry["items"])
+    with _news_store_lock:
+        lock = _news_store_locks.setdefault(symbol, threading.Lock())
+    with lock:
+        entry = _news_store.get(symbol)
+        if entry and (time.time() - entry["time"]) < NEWS_CACHE_TTL:
+            return list(entry["items"])
+        try:
+            items = _fetch_news_feed(symbol)
+        except Exception as exc:
+            if not entry:
+                raise
+            entry["time"] = time.time()
+            entry["error"] = str(exc) or "Error News"
+            return list(entry["items"])
+        if entry is None:
+            entry = {"time": 0.0, "items": [], "guids": set(), "error": ""}
+        _merge_news_items(entry, items)
+        entry["time"] = time.time()
+        entry["error"] = ""
+        _news_store[symbol] = entry
+        return list(entry["items"])
+
+
+def _get_news(symbol, limit=None):
+    items = _get_news_items(symbol)
     if limit is None:
         limit = NEWS_PER_SYMBOL_LIMIT
-    return items[:limit] if limit else []
+    if not limit:
+        return []
+    return [
+        {
+            "title": item.get("title"),
+            "link": item.get("link"),
+            "date": item.get("date"),
+            "source": item.get("source"),
+        }
+        for item in items[:limit]
+    ]
 
 
 def _parse_iso_date(value):
@@ -2530,14 +3819,38 @@ PRESS_PAGE_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9,es;q=0.8",
 }
 
-_press_discovery_cache = {}
+_press_discovery_cache = None
+_press_discovery_lock = threading.Lock()
+PRESS_DISCOVERY_CACHE_PATH = os.environ.get(
+    "PRESS_DISCOVERY_CACHE_PATH",
+    os.path.join(os.path.dirname(__file__), "press_discovery.json"),
+)
+PRESS_DISCOVERY_TTL = int(os.environ.get("PRESS_DISCOVERY_TTL", str(60 * 60 * 24)))
+PRESS_DISCOVERY_NEGATIVE_TTL = int(
+    os.environ.get("PRESS_DISCOVERY_NEGATIVE_TTL", str(60 * 60))
+)
+PRESS_DISCOVERY_BACKOFF_MAX = int(
+    os.environ.get("PRESS_DISCOVERY_BACKOFF_MAX", str(60 * 60 * 24 * 7))
+)
 _press_page_cache = {}
 PRESS_PAGE_CACHE_TTL = int(os.environ.get("PRESS_PAGE_CACHE_TTL", "1800"))
 _press_feed_cache = {}
 PRESS_FEED_CACHE_TTL = int(os.environ.get("PRESS_FEED_CACHE_TTL", "1800"))
+_feed_state = {}
+FEED_STATE_MAX_ITEMS = 200
+FEED_PARSE_CHUNK = 16384
 PRESS_FEED_TIMEOUT = int(os.environ.get("PRESS_FEED_TIMEOUT", "4"))
 PRESS_PAGE_TIMEOUT = int(os.environ.get("PRESS_PAGE_TIMEOUT", "6"))
 PRESS_FETCH_BUDGET_SEC = int(os.environ.get("PRESS_FETCH_BUDGET_SEC", "12"))
+PRESS_SOURCE_DEADLINE_SEC = float(os.environ.get("PRESS_SOURCE_DEADLINE_SEC", "8"))
+PRESS_FETCH_WORKERS = max(1, int(os.environ.get("PRESS_FETCH_WORKERS", "16")))
+PRESS_STORE_TTL = int(os.environ.get("PRESS_STORE_TTL", "300"))
+_press_store = {}
+_press_store_lock = threading.Lock()
+_press_store_inflight = {}
+_press_executor = ThreadPoolExecutor(
+    max_workers=PRESS_FETCH_WORKERS, thread_name_prefix="press-fetch"
+)
 PRESS_MAX_AGE_HOURS = int(os.environ.get("PRESS_MAX_AGE_HOURS", "0"))
 EVENT_WINDOW_HOURS = int(os.environ.get("EVENT_WINDOW_HOURS", "24"))
 
@@ -2645,18 +3958,99 @@ def _get_press_allowed_domains(symbol):
     return [domain.lower() for domain in domains if domain]
 
 
+def _load_press_discovery_cache():
+    global _press_discovery_cache
+    if _press_discovery_cache is not None:
+        return _press_discovery_cache
+    with _press_discovery_lock:
+        if _press_discovery_cache is not None:
+            return _press_discovery_cache
+        data = {}
+        try:
+            with open(PRESS_DISCOVERY_CACHE_PATH, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        pages = data.get("pages")
+        dead_feeds = data.get("deadFeeds")
+        _press_discovery_cache = {
+            "pages": pages if isinstance(pages, dict) else {},
+            "deadFeeds": dead_feeds if isinstance(dead_feeds, dict) else {},
+        }
+    return _press_discovery_cache
+
+
+def _save_press_discovery_cache():
+    cache = _load_press_discovery_cache()
+    tmp_path = f"{PRESS_DISCOVERY_CACHE_PATH}.tmp"
+    try:
+        with _press_discovery_lock:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(cache, handle, ensure_ascii=True)
+            os.replace(tmp_path, PRESS_DISCOVERY_CACHE_PATH)
+    except OSError:
+        return
+
+
+def _press_backoff_delay(failures):
+    delay = PRESS_DISCOVERY_NEGATIVE_TTL * (2 ** max(0, failures - 1))
+    return min(delay, PRESS_DISCOVERY_BACKOFF_MAX)
+
+
 def _press_discovery_cache_get(url):
-    cached = _press_discovery_cache.get(url)
-    if not cached:
+    entry = _load_press_discovery_cache()["pages"].get(url)
+    if not isinstance(entry, dict):
         return None
-    if (time.time() - cached["time"]) >= PRESS_PAGE_CACHE_TTL:
-        del _press_discovery_cache[url]
+    if time.time() >= (entry.get("expires") or 0):
         return None
-    return cached["feeds"]
+    return entry.get("feeds") or []
+
+
+def _press_discovery_cache_set(url, feeds, failed=False):
+    pages = _load_press_discovery_cache()["pages"]
+    now = time.time()
+    with _press_discovery_lock:
+        previous = pages.get(url) if isinstance(pages.get(url), dict) else {}
+        if failed:
+            failures = (previous.get("failures") or 0) + 1
+            entry = {
+                "feeds": previous.get("feeds") or [],
+                "failures": failures,
+                "expires": now + _press_backoff_delay(failures),
+            }
+        else:
+            ttl = PRESS_DISCOVERY_TTL if feeds else PRESS_DISCOVERY_NEGATIVE_TTL
+            entry = {"feeds": feeds, "failures": 0, "expires": now + ttl}
+        entry["time"] = now
+        pages[url] = entry
+    _save_press_discovery_cache()
+    return entry["feeds"]
+
+
+def _press_feed_alive(url):
+    entry = _load_press_discovery_cache()["deadFeeds"].get(url)
+    if not isinstance(entry, dict):
+        return True
+    return time.time() >= (entry.get("retryAt") or 0)
 
 
-def _press_discovery_cache_set(url, feeds):
-    _press_discovery_cache[url] = {"time": time.time(), "feeds": feeds}
+def _record_press_feed_result(url, ok):
+    dead_feeds = _load_press_discovery_cache()["deadFeeds"]
+    with _press_discovery_lock:
+        if ok:
+            if url not in dead_feeds:
+                return
+            dead_feeds.pop(url, None)
+        else:
+            previous = dead_feeds.get(url) if isinstance(dead_feeds.get(url), dict) else {}
+            failures = (previous.get("failures") or 0) + 1
+            dead_feeds[url] = {
+                "failures": failures,
+                "retryAt": time.time() + _press_backoff_delay(failures),
+            }
+    _save_press_discovery_cache()
 
 
 def _get_press_source_pages_for_symbol(symbol):
@@ -2728,15 +4122,26 @@ def _guess_feed_urls(page_url):
     return list(dict.fromkeys(guesses))
 
 
-def _discover_feed_urls(page_url):
+def _press_timeout(timeout, deadline):
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("Tiempo de lectura agotado")
+    return min(timeout, remaining)
+
+
+def _discover_feed_urls(page_url, deadline=None):
     cached = _press_discovery_cache_get(page_url)
     if cached is not None:
         return cached
+    timeout = _press_timeout(PRESS_PAGE_TIMEOUT, deadline)
     try:
-        payload = _fetch_text(page_url, PRESS_PAGE_HEADERS, timeout=PRESS_PAGE_TIMEOUT)
+        payload = _fetch_text(page_url, PRESS_PAGE_HEADERS, timeout=timeout)
     except Exception:
-        _press_discovery_cache_set(page_url, [])
-        return []
+        if timeout < PRESS_PAGE_TIMEOUT:
+            raise
+        return _press_discovery_cache_set(page_url, [], failed=True)
     if _parse_feed_items(payload):
         _press_discovery_cache_set(page_url, [page_url])
         return [page_url]
@@ -2962,13 +4367,16 @@ def _collect_anchor_press_items(payload, page_url):
     return items
 
 
-def _fetch_press_page_items(page_url, symbol, use_cache=True, raise_errors=False):
+def _fetch_press_page_items(
+    page_url, symbol, use_cache=True, raise_errors=False, deadline=None
+):
     if use_cache:
         cached = _press_page_cache_get(page_url)
         if cached is not None:
             return [dict(item, symbol=symbol) for item in cached]
+    timeout = _press_timeout(PRESS_PAGE_TIMEOUT, deadline)
     try:
-        payload = _fetch_text(page_url, PRESS_PAGE_HEADERS, timeout=PRESS_PAGE_TIMEOUT)
+        payload = _fetch_text(page_url, PRESS_PAGE_HEADERS, timeout=timeout)
     except Exception:
         if raise_errors:
             raise
@@ -3003,67 +4411,114 @@ def _fetch_press_page_items(page_url, symbol, use_cache=True, raise_errors=False
     return normalized
 
 
-def _parse_feed_items(payload):
+def _feed_entry_fields(entry, atom):
+    if atom:
+        title = entry.findtext("{*}title") or ""
+        link = ""
+        link_el = (
+            entry.find("{*}link[@rel='alternate']") or entry.find("{*}link")
+        )
+        if link_el is not None:
+            link = link_el.get("href") or (link_el.text or "")
+        date = entry.findtext("{*}updated") or entry.findtext("{*}published") or ""
+        source = entry.findtext("{*}source/{*}title") or ""
+        guid = entry.findtext("{*}id") or ""
+    else:
+        title = entry.findtext("title") or entry.findtext("{*}title") or ""
+        link = entry.findtext("link") or entry.findtext("{*}link") or ""
+        date = (
+            entry.findtext("pubDate")
+            or entry.findtext("{*}pubDate")
+            or entry.findtext("{*}date")
+            or ""
+        )
+        source = entry.findtext("source") or entry.findtext("{*}source") or ""
+        guid = entry.findtext("guid") or entry.findtext("{*}guid") or ""
+    return {
+        "title": title,
+        "link": link,
+        "date": date,
+        "source": source,
+        "guid": (guid or link or title).strip(),
+    }
+
+
+def _parse_feed_items(payload, seen=None):
+    parser = ET.XMLPullParser(("start", "end"))
+    items = []
+    atom = None
+    chunks = [
+        payload[start : start + FEED_PARSE_CHUNK]
+        for start in range(0, len(payload), FEED_PARSE_CHUNK)
+    ]
     try:
-        root = ET.fromstring(payload)
+        for chunk in chunks + [None]:
+            if chunk is None:
+                parser.close()
+            else:
+                parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if atom is None:
+                        atom = elem.tag.endswith("feed")
+                    continue
+                if _strip_xml_ns(elem.tag) != ("entry" if atom else "item"):
+                    continue
+                item = _feed_entry_fields(elem, atom)
+                elem.clear()
+                if seen and item["guid"] in seen:
+                    return items
+                items.append(item)
     except Exception:
         return []
-    items = []
-    if root.tag.endswith("feed"):
-        for entry in root.findall(".//{*}entry"):
-            title = entry.findtext("{*}title") or ""
-            link = ""
-            link_el = (
-                entry.find("{*}link[@rel='alternate']") or entry.find("{*}link")
-            )
-            if link_el is not None:
-                link = link_el.get("href") or (link_el.text or "")
-            date = entry.findtext("{*}updated") or entry.findtext("{*}published") or ""
-            source = entry.findtext("{*}source/{*}title") or ""
-            items.append(
-                {
-                    "title": title,
-                    "link": link,
-                    "date": date,
-                    "source": source,
-                }
-            )
-    else:
-        for entry in root.findall(".//{*}item"):
-            title = entry.findtext("title") or entry.findtext("{*}title") or ""
-            link = entry.findtext("link") or entry.findtext("{*}link") or ""
-            date = (
-                entry.findtext("pubDate")
-                or entry.findtext("{*}pubDate")
-                or entry.findtext("{*}date")
-                or ""
-            )
-            source = entry.findtext("source") or entry.findtext("{*}source") or ""
-            items.append(
-                {
-                    "title": title,
-                    "link": link,
-                    "date": date,
-                    "source": source,
-                }
-            )
     return items
 
 
-def _fetch_press_feed_items(url, symbol, use_cache=True, raise_errors=False):
+def _poll_feed(url, headers, timeout):
+    state = _feed_state.get(url)
+    request_headers = dict(headers)
+    if state:
+        if state["etag"]:
+            request_headers["If-None-Match"] = state["etag"]
+        if state["lastModified"]:
+            request_headers["If-Modified-Since"] = state["lastModified"]
+    status, body, response_headers = _http_fetch(
+        url, request_headers, timeout=timeout, with_status=True
+    )
+    if status == 304 and state:
+        return state["items"]
+    previous = state["items"] if state else []
+    fresh = _parse_feed_items(
+        body.decode("utf-8"), set(state["guids"]) if state else None
+    )
+    if not fresh and not previous:
+        return []
+    items = (fresh + previous)[:FEED_STATE_MAX_ITEMS]
+    _feed_state[url] = {
+        "etag": response_headers.get("ETag") or "",
+        "lastModified": response_headers.get("Last-Modified") or "",
+        "items": items,
+        "guids": {item["guid"] for item in items},
+    }
+    return items
+
+
+def _fetch_press_feed_items(
+    url, symbol, use_cache=True, raise_errors=False, deadline=None
+):
     parsed = None
     if use_cache:
         parsed = _press_feed_cache_get(url)
     if parsed is None:
+        timeout = _press_timeout(PRESS_FEED_TIMEOUT, deadline)
         try:
-            payload = _fetch_text(url, PRESS_FEED_HEADERS, timeout=PRESS_FEED_TIMEOUT)
+            parsed = _poll_feed(url, PRESS_FEED_HEADERS, timeout)
         except Exception:
             if raise_errors:
                 raise
             if use_cache:
                 _press_feed_cache_set(url, [])
             return []
-        parsed = _parse_feed_items(payload)
         if use_cache:
             _press_feed_cache_set(url, parsed)
     if not parsed:
@@ -3095,66 +4550,158 @@ def _fetch_press_feed_items(url, symbol, use_cache=True, raise_errors=False):
     return items
 
 
+def _press_task_runner(started, index, func, args, budget_end):
+    started[index] = time.monotonic()
+    deadline = min(started[index] + PRESS_SOURCE_DEADLINE_SEC, budget_end)
+    return func(*args, deadline=deadline)
+
+
+def _run_press_tasks(tasks):
+    results = [(None, "Tiempo de lectura agotado")] * len(tasks)
+    if not tasks:
+        return results
+    started = {}
+    budget_end = time.monotonic() + PRESS_FETCH_BUDGET_SEC
+    futures = {
+        _press_executor.submit(
+            _press_task_runner, started, index, func, args, budget_end
+        ): index
+        for index, (_, func, args) in enumerate(tasks)
+    }
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+        for future in done:
+            index = futures[future]
+            try:
+                results[index] = (future.result(), "")
+            except Exception as exc:
+                results[index] = (None, str(exc) or "Error Press")
+        now = time.monotonic()
+        for future in list(pending):
+            begun = started.get(futures[future])
+            if now >= budget_end or (
+                begun is not None and (now - begun) >= PRESS_SOURCE_DEADLINE_SEC
+            ):
+                future.cancel()
+                pending.discard(future)
+    return results
+
+
+def _fetch_press_source_items(
+    page_url, symbol, skip_feeds=(), use_cache=True, raise_errors=False, deadline=None
+):
+    discovered = _discover_feed_urls(page_url, deadline=deadline)
+    if not discovered:
+        return _fetch_press_page_items(
+            page_url,
+            symbol,
+            use_cache=use_cache,
+            raise_errors=raise_errors,
+            deadline=deadline,
+        )
+    items = []
+    first_error = None
+    for url in discovered:
+        if url in skip_feeds or not _press_feed_alive(url):
+            continue
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        full_timeout = (
+            deadline is None or (deadline - time.monotonic()) >= PRESS_FEED_TIMEOUT
+        )
+        try:
+            items.extend(
+                _fetch_press_feed_items(
+                    url,
+                    symbol,
+                    use_cache=use_cache,
+                    raise_errors=True,
+                    deadline=deadline,
+                )
+            )
+        except Exception as exc:
+            if full_timeout:
+                _record_press_feed_result(url, False)
+            first_error = first_error or exc
+            continue
+        _record_press_feed_result(url, True)
+    if raise_errors and first_error is not None and not items:
+        raise first_error
+    return items
+
+
+def _fetch_press_fallback_news(symbol, limit, deadline=None):
+    return _get_news(symbol, limit)
+
+
+def _collect_press_items(symbols, use_cache=True, raise_errors=False, extra_tasks=()):
+    tasks = list(extra_tasks)
+    for symbol in symbols:
+        feed_urls = list(
+            dict.fromkeys(url for url in _get_press_feed_urls_for_symbol(symbol) if url)
+        )
+        for page in _get_press_source_pages_for_symbol(symbol):
+            tasks.append(
+                (
+                    symbol,
+                    _fetch_press_source_items,
+                    (page, symbol, set(feed_urls), use_cache, raise_errors),
+                )
+            )
+        for url in feed_urls:
+            tasks.append(
+                (symbol, _fetch_press_feed_items, (url, symbol, use_cache, raise_errors))
+            )
+    items_by_symbol = {}
+    errors = []
+    for (symbol, _, _), (items, error) in zip(tasks, _run_press_tasks(tasks)):
+        if error:
+            errors.append({"ticker": symbol, "fuente": "PRESS", "error": error})
+        if items:
+            items_by_symbol.setdefault(symbol, []).extend(items)
+    return items_by_symbol, errors
+
+
 def _get_press_stream(symbols):
     cache_key = tuple(symbols)
     cached = _press_cache.get(cache_key)
     if cached and (time.time() - cached["time"]) < NEWS_CACHE_TTL:
         return cached["data"]
 
-    start_time = time.time()
-    items = []
     global_urls = _get_press_feed_global_urls()
-    for url in global_urls:
-        if (time.time() - start_time) >= PRESS_FETCH_BUDGET_SEC:
-            break
-        items.extend(_fetch_press_feed_items(url, ""))
+    extra_tasks = [("", _fetch_press_feed_items, (url, "")) for url in global_urls]
+    items_by_symbol, _ = _collect_press_items(symbols, extra_tasks=extra_tasks)
+    items = list(items_by_symbol.pop("", []))
+    missing = []
     for symbol in symbols:
-        if (time.time() - start_time) >= PRESS_FETCH_BUDGET_SEC:
-            break
-        symbol_has_items = False
-        feed_urls = _get_press_feed_urls_for_symbol(symbol)
-        source_pages = _get_press_source_pages_for_symbol(symbol)
-        for page in source_pages:
-            if (time.time() - start_time) >= PRESS_FETCH_BUDGET_SEC:
-                break
-            discovered = _discover_feed_urls(page)
-            if discovered:
-                feed_urls.extend(discovered)
-            else:
-                page_items = _fetch_press_page_items(page, symbol)
-                if page_items:
-                    symbol_has_items = True
-                    items.extend(page_items)
-        feed_urls = list(dict.fromkeys([url for url in feed_urls if url]))
-        for url in feed_urls:
-            if (time.time() - start_time) >= PRESS_FETCH_BUDGET_SEC:
-                break
-            feed_items = _fetch_press_feed_items(url, symbol)
-            if feed_items:
-                symbol_has_items = True
-                items.extend(feed_items)
-        if (time.time() - start_time) >= PRESS_FETCH_BUDGET_SEC:
-            break
-        if not symbol_has_items:
-            try:
-                entries = _get_news(symbol, limit=NEWS_FETCH_LIMIT)
-            except Exception:
+        symbol_items = items_by_symbol.get(symbol) or []
+        if symbol_items:
+            items.extend(symbol_items)
+        else:
+            missing.append(symbol)
+    fallback_tasks = [
+        (symbol, _fetch_press_fallback_news, (symbol, NEWS_FETCH_LIMIT))
+        for symbol in missing
+    ]
+    for (symbol, _, _), (entries, error) in zip(
+        fallback_tasks, _run_press_tasks(fallback_tasks)
+    ):
+        for entry in entries or []:
+            if not _is_press_release(entry):
                 continue
-            for entry in entries:
-                if not _is_press_release(entry):
-                    continue
-                timestamp = _parse_rss_date(entry.get("date"))
-                items.append(
-                    {
-                        "title": entry.get("title"),
-                        "link": entry.get("link"),
-                        "date": entry.get("date"),
-                        "source": entry.get("source"),
-                        "symbol": symbol,
-                        "timestamp": timestamp,
-                        "feedUrl": "yahoo",
-                    }
-                )
+            timestamp = _parse_rss_date(entry.get("date"))
+            items.append(
+                {
+                    "title": entry.get("title"),
+                    "link": entry.get("link"),
+                    "date": entry.get("date"),
+                    "source": entry.get("source"),
+                    "symbol": symbol,
+                    "timestamp": timestamp,
+                    "feedUrl": "yahoo",
+                }
+            )
 
     max_age_hours = _press_max_age_hours()
     if max_age_hours > 0:
@@ -3356,13 +4903,12 @@ def _get_latest_filing_event(symbol):
 
 def _get_recent_filings(symbol, cutoff_ts, max_items=None):
     symbol = symbol.upper()
-    cik_map = _get_cik_map()
-    cik = cik_map.get(symbol)
+    cik = _lookup_cik(symbol)
     if not cik:
         raise ValueError("No hay CIK para este ticker")
 
-    url = SEC_SUBMISSION_URL.format(cik=cik)
-    data = _fetch_json(url, _sec_headers())
+    _edgar_watch_symbol(symbol, cik)
+    data = _get_submissions(cik)
     filings = data.get("filings", {}).get("recent", {})
     accession_numbers = filings.get("accessionNumber", [])
     forms = filings.get("form", [])
@@ -3382,9 +4928,7 @@ def _get_recent_filings(symbol, cutoff_ts, max_items=None):
         if cutoff_ts and not timestamp:
             continue
         primary = primary_docs[idx] if idx < len(primary_docs) else ""
-        accession_no = accession.replace("-", "")
-        base = f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{accession_no}"
-        link = f"{base}/{primary}" if primary else f"{base}/{accession}-index.html"
+        link = _filing_item_link(cik, accession, primary)
         items.append(
             {
                 "symbol": symbol,
@@ -3427,10 +4971,8 @@ def _get_news_events(symbols, cutoff_ts):
     events = []
     errors = []
     for symbol in symbols:
-        url = NEWS_FEED_URL.format(symbol=urllib.parse.quote(symbol))
         try:
-            payload = _fetch_text(url, NEWS_HEADERS)
-            root = ET.fromstring(payload)
+            entries = _get_news_items(symbol)
         except Exception as exc:
             errors.append(
                 {
@@ -3440,12 +4982,12 @@ def _get_news_events(symbols, cutoff_ts):
                 }
             )
             continue
-        for item in root.findall(".//item"):
-            title = item.findtext("title") or ""
-            link = item.findtext("link") or ""
-            date = item.findtext("pubDate") or ""
-            source = item.findtext("source") or ""
-            timestamp = _parse_rss_date(date) or 0
+        for item in entries:
+            title = item.get("title") or ""
+            link = item.get("link") or ""
+            date = item.get("date") or ""
+            source = item.get("source") or ""
+            timestamp = item.get("timestamp") or 0
             if cutoff_ts and timestamp and timestamp < cutoff_ts:
                 continue
             if cutoff_ts and not timestamp:
@@ -3468,68 +5010,83 @@ def _get_news_events(symbols, cutoff_ts):
     return events, errors
 
 
-def _get_press_events(symbols, cutoff_ts):
-    events = []
-    errors = []
-    start_time = time.time()
-    for symbol in symbols:
-        if (time.time() - start_time) >= PRESS_FETCH_BUDGET_SEC:
-            errors.append(
-                {
-                    "ticker": symbol,
-                    "fuente": "PRESS",
-                    "error": "Tiempo de lectura agotado",
-                }
+def _refresh_press_store(symbols):
+    try:
+        items_by_symbol, errors = _collect_press_items(
+            symbols, use_cache=False, raise_errors=True
+        )
+    except Exception as exc:
+        items_by_symbol = None
+        errors = [
+            {"ticker": symbol, "fuente": "PRESS", "error": str(exc) or "Error Press"}
+            for symbol in symbols
+        ]
+    now = time.time()
+    with _press_store_lock:
+        for symbol in symbols:
+            entry = _press_store.setdefault(
+                symbol, {"time": 0.0, "items": [], "errors": [], "refreshing": False}
             )
-            continue
-        feed_urls = _get_press_feed_urls_for_symbol(symbol)
-        source_pages = _get_press_source_pages_for_symbol(symbol)
-        items = []
-        for page in source_pages:
-            if (time.time() - start_time) >= PRESS_FETCH_BUDGET_SEC:
-                break
-            discovered = _discover_feed_urls(page)
-            if discovered:
-                feed_urls.extend(discovered)
-                continue
-            try:
-                page_items = _fetch_press_page_items(
-                    page,
-                    symbol,
-                    use_cache=False,
-                    raise_errors=True,
-                )
-            except Exception as exc:
-                errors.append(
-                    {
-                        "ticker": symbol,
-                        "fuente": "PRESS",
-                        "error": str(exc) or "Error Press Page",
-                    }
-                )
-                continue
-            items.extend(page_items)
-        feed_urls = list(dict.fromkeys([url for url in feed_urls if url]))
-        for url in feed_urls:
-            if (time.time() - start_time) >= PRESS_FETCH_BUDGET_SEC:
-                break
-            try:
-                feed_items = _fetch_press_feed_items(
-                    url,
-                    symbol,
-                    use_cache=False,
-                    raise_errors=True,
-                )
-            except Exception as exc:
-                errors.append(
-                    {
-                        "ticker": symbol,
-                        "fuente": "PRESS",
-                        "error": str(exc) or "Error Press Feed",
-                    }
-                )
-                continue
-            items.extend(feed_items)
+            symbol_errors = [error for error in errors if error["ticker"] == symbol]
+            symbol_items = (items_by_symbol or {}).get(symbol) or []
+            if symbol_items or not symbol_errors:
+                entry["items"] = symbol_items
+            entry["errors"] = symbol_errors
+            entry["time"] = now
+            entry["refreshing"] = False
+
+
+def _get_press_store(symbols):
+    now = time.time()
+    missing = []
+    waiting = []
+    stale = []
+    with _press_store_lock:
+        for symbol in symbols:
+            entry = _press_store.get(symbol)
+            if entry is None:
+                event = _press_store_inflight.get(symbol)
+                if event is None:
+                    _press_store_inflight[symbol] = threading.Event()
+                    missing.append(symbol)
+                else:
+                    waiting.append(event)
+            elif (now - entry["time"]) >= PRESS_STORE_TTL and not entry["refreshing"]:
+                entry["refreshing"] = True
+                stale.append(symbol)
+    if stale:
+        threading.Thread(
+            target=_refresh_press_store,
+            args=(stale,),
+            name="press-refresh",
+            daemon=True,
+        ).start()
+    if missing:
+        try:
+            _refresh_press_store(missing)
+        finally:
+            with _press_store_lock:
+                for symbol in missing:
+                    _press_store_inflight.pop(symbol).set()
+    if waiting:
+        deadline = time.time() + PRESS_FETCH_BUDGET_SEC + PRESS_SOURCE_DEADLINE_SEC
+        for event in waiting:
+            event.wait(max(0.0, deadline - time.time()))
+    with _press_store_lock:
+        return {
+            symbol: (list(entry["items"]), list(entry["errors"]))
+            for symbol, entry in _press_store.items()
+            if symbol in symbols
+        }
+
+
+def _get_press_events(symbols, cutoff_ts):
+    events = []
+    errors = []
+    store = _get_press_store(symbols)
+    for symbol in symbols:
+        items, symbol_errors = store.get(symbol, ([], []))
+        errors.extend(symbol_errors)
         for item in items:
             timestamp = (
                 item.get("timestamp")
@@ -3643,11 +5200,7 @@ def _get_events(symbols):
     return deduped, _dedupe_errors(errors)
 
 
-def _parse_stooq_csv(payload):
-    lines = [line.strip() for line in payload.splitlines() if line.strip()]
-    if len(lines) < 2:
-        return None
-    values = lines[1].split(",")
+def _parse_stooq_row(values):
     if len(values) < 8:
         return None
     open_price = _to_float(values[3])
@@ -3662,13 +5215,30 @@ def _parse_stooq_csv(payload):
     }
 
 
-def _fetch_stooq_quote(symbol, previous_close=None):
-    stooq_symbol = f"{symbol.lower()}.us"
-    url = STOOQ_URL.format(symbol=urllib.parse.quote(stooq_symbol))
-    payload = _fetch_text(url, STOOQ_HEADERS)
-    parsed = _parse_stooq_csv(payload)
-    if not parsed:
-        return None
+def _stooq_row_symbol(value):
+    symbol = (value or "").strip().upper()
+    if symbol.endswith(".US"):
+        symbol = symbol[:-3]
+    return symbol
+
+
+def _parse_stooq_csv(payload, all_rows=False):
+    lines = [line.strip() for line in payload.splitlines() if line.strip()]
+    if len(lines) < 2:
+        return {} if all_rows else None
+    if not all_rows:
+        return _parse_stooq_row(lines[1].split(","))
+    rows = {}
+    for line in lines[1:]:
+        values = line.split(",")
+        parsed = _parse_stooq_row(values)
+        symbol = _stooq_row_symbol(values[0])
+        if parsed and symbol:
+            rows[symbol] = parsed
+    return rows
+
+
+def _stooq_quote_from_parsed(parsed, previous_close=None):
     price = parsed["price"]
     change = None
     base = previous_close
@@ -3688,20 +5258,47 @@ def _fetch_stooq_quote(symbol, previous_close=None):
     }
 
 
+def _fetch_stooq_quote(symbol, previous_close=None):
+    stooq_symbol = f"{symbol.lower()}.us"
+    url = STOOQ_URL.format(symbol=urllib.parse.quote(stooq_symbol))
+    _throttle_host(url)
+    payload = _fetch_text(url, STOOQ_HEADERS)
+    parsed = _parse_stooq_csv(payload)
+    if not parsed:
+        return None
+    return _stooq_quote_from_parsed(parsed, previous_close)
+
+
+def _fetch_stooq_batch(symbols):
+    stooq_symbols = "+".join(f"{symbol.lower()}.us" for symbol in symbols)
+    url = STOOQ_URL.format(symbol=urllib.parse.quote(stooq_symbols, safe="+"))
+    _throttle_host(url)
+    started = time.monotonic()
+    try:
+        payload = _fetch_text(url, STOOQ_HEADERS)
+        rows = _parse_stooq_csv(payload, all_rows=True)
+    except Exception:
+        _record_provider_call("stooq", False, time.monotonic() - started)
+        return {}
+    _record_provider_call("stooq", bool(rows), time.monotonic() - started)
+    return rows
+
+
 def fetch_stooq_quotes(symbols):
+    chunks = [
+        tuple(symbols[index : index + STOOQ_BATCH_SIZE])
+        for index in range(0, len(symbols), STOOQ_BATCH_SIZE)
+    ]
+    batches = _map_concurrent(_fetch_stooq_batch, chunks, _quote_fetch_workers())
     results = {}
-    for symbol in symbols:
-        entry = _symbol_cache.get(symbol)
-        prev_close = None
-        if entry and entry.get("data"):
-            prev_close = entry["data"].get("previousClose")
-        try:
-            quote = _fetch_stooq_quote(symbol, prev_close)
-            if quote:
-                results[symbol] = quote
-        except Exception:
-            continue
-        time.sleep(0.08)
+    for chunk in chunks:
+        rows = batches.get(chunk) or {}
+        for symbol in chunk:
+            parsed = rows.get(symbol.upper())
+            if not parsed:
+                continue
+            quote = _stooq_quote_from_parsed(parsed, _cached_previous_close(symbol))
+            results[symbol] = dict(quote, source="stooq")
     return results
 
 
@@ -3808,6 +5405,46 @@ def _nasdaq_range_from_values(*values):
     return None, None
 
 
+def _next_market_session_boundary(now=None):
+    now = now or datetime.now(MARKET_TZ)
+    for offset in range(8):
+        day = now.date() + timedelta(days=offset)
+        if day.weekday() >= 5:
+            continue
+        for boundary in MARKET_SESSION_BOUNDARIES:
+            candidate = datetime.combine(day, boundary, tzinfo=MARKET_TZ)
+            if candidate > now:
+                return candidate
+    return now + timedelta(seconds=NASDAQ_SUMMARY_MAX_TTL)
+
+
+def _nasdaq_summary_expiry():
+    now = datetime.now(MARKET_TZ)
+    boundary = _next_market_session_boundary(now)
+    ttl = min((boundary - now).total_seconds(), NASDAQ_SUMMARY_MAX_TTL)
+    return time.time() + max(60.0, ttl)
+
+
+def _get_nasdaq_summary(symbol):
+    cached = _nasdaq_summary_cache.get(symbol)
+    if cached and time.time() < cached["expires"]:
+        return cached["payload"]
+    summary_url = NASDAQ_SUMMARY_URL.format(
+        symbol=urllib.parse.quote(symbol)
+    )
+    try:
+        payload = _fetch_nasdaq_json(summary_url)
+    except Exception:
+        payload = None
+    if isinstance(payload, dict) and isinstance(payload.get("data"), dict):
+        expires = _nasdaq_summary_expiry()
+    else:
+        payload = cached.get("payload") if cached else None
+        expires = time.time() + NASDAQ_SUMMARY_ERROR_TTL
+    _nasdaq_summary_cache[symbol] = {"payload": payload, "expires": expires}
+    return payload
+
+
 def _fetch_nasdaq_quote(symbol):
     url = NASDAQ_DATA_URL.format(symbol=urllib.parse.quote(symbol))
     payload = _fetch_nasdaq_json(url)
@@ -3854,30 +5491,24 @@ def _fetch_nasdaq_quote(symbol):
     if price is None:
         return None
 
-    summary_url = NASDAQ_SUMMARY_URL.format(
-        symbol=urllib.parse.quote(symbol)
-    )
-    try:
-        summary_payload = _fetch_nasdaq_json(summary_url)
-    except Exception:
-        summary_payload = None
+    summary_payload = _get_nasdaq_summary(symbol)
     previous_close = _nasdaq_previous_close_from_summary(summary_payload)
     summary_volume = _nasdaq_pick_value(
-        summary_payload,
         payload,
+        summary_payload,
         "sharevolume",
         "volume",
     )
     summary_day_range = _nasdaq_pick_value(
-        summary_payload,
         payload,
+        summary_payload,
         "todayshighlow",
         "todayhighlow",
         "dayrange",
         "dayhighlow",
     )
-    summary_day_high = _nasdaq_pick_value(summary_payload, payload, "dayhigh")
-    summary_day_low = _nasdaq_pick_value(summary_payload, payload, "daylow")
+    summary_day_high = _nasdaq_pick_value(payload, summary_payload, "dayhigh")
+    summary_day_low = _nasdaq_pick_value(payload, summary_payload, "daylow")
     summary_week_range = _nasdaq_pick_value(
         summary_payload,
         payload,
@@ -3964,6 +5595,11 @@ def _fetch_nasdaq_quote(symbol):
         day_low = range_day_low
     if day_high is None:
         day_high = range_day_high
+    if regular_price is not None:
+        if day_low is not None:
+            day_low = min(day_low, regular_price)
+        if day_high is not None:
+            day_high = max(day_high, regular_price)
     week52_low = _nasdaq_first_number(
         primary.get("fiftyTwoWeekLow"),
         data.get("fiftyTwoWeekLow"),
@@ -4043,17 +5679,18 @@ def _fetch_nasdaq_quote(symbol):
 
 
 def fetch_nasdaq_quotes(symbols):
+    quotes = _map_concurrent(
+        lambda symbol: _fetch_symbol_quote("nasdaq", symbol),
+        symbols,
+        _quote_fetch_workers(),
+    )
     results = {}
     for symbol in symbols:
-        try:
-            quote = _fetch_nasdaq_quote(symbol)
-        except Exception:
-            quote = None
+        quote = quotes.get(symbol)
         if quote:
             results[symbol] = quote
         else:
             results[symbol] = {"error": "Sin datos Nasdaq"}
-        time.sleep(0.08)
     return results
 
 
@@ -4178,6 +5815,7 @@ def _consume_credits(amount):
     now = time.time()
     for _ in range(amount):
         _credit_log.append(now)
+    _twelve_bucket["tokens"] = max(0.0, _twelve_bucket["tokens"] - amount)
     _consume_daily_credits(amount)
 
 
@@ -4194,15 +5832,79 @@ def _eligible_symbols(symbols):
     return [symbol for _, __, symbol in candidates]
 
 
-def _rotation_batch(symbols, batch_size):
-    if not symbols or batch_size <= 0:
+def _demand_score(symbol, now=None):
+    entry = _symbol_demand.get(symbol)
+    if not entry:
+        return 0.0
+    score, seen_at = entry
+    now = now or time.time()
+    elapsed = max(0.0, now - seen_at)
+    return score * (0.5 ** (elapsed / max(1, DEMAND_HALF_LIFE_SEC)))
+
+
+def _alert_levels(symbol):
+    config = load_config()
+    levels = config.get("alertLevels") or {}
+    if not isinstance(levels, dict):
         return []
-    total = len(symbols)
-    if total <= batch_size:
-        return list(symbols)
-    minute = int(time.time() // 60)
-    start = (minute * batch_size) % total
-    return [symbols[(start + offset) % total] for offset in range(batch_size)]
+    entry = levels.get(symbol.upper()) or levels.get(symbol.lower())
+    if not isinstance(entry, list):
+        entry = [entry]
+    values = [_to_float(value) for value in entry]
+    return [value for value in values if value]
+
+
+def _alert_proximity(symbol):
+    entry = _symbol_cache.get(symbol)
+    price = _to_float((entry or {}).get("data", {}).get("price"))
+    if not price:
+        return 0.0
+    levels = _alert_levels(symbol)
+    if not levels or ALERT_PROXIMITY_PCT <= 0:
+        return 0.0
+    distance_pct = min(abs(price - level) / price * 100 for level in levels)
+    return max(0.0, 1.0 - (distance_pct / ALERT_PROXIMITY_PCT))
+
+
+def _prioritized_symbols(symbols):
+    now = time.time()
+    min_refresh = _min_symbol_refresh_sec()
+    candidates = []
+    for index, symbol in enumerate(symbols):
+        entry = _symbol_cache.get(symbol)
+        last_update = entry.get("updatedAt") if entry else 0
+        proximity = _alert_proximity(symbol)
+        required_age = min_refresh * (1.0 - 0.5 * proximity)
+        age = (now - last_update) if last_update else None
+        if age is not None and age < required_age:
+            continue
+        staleness = 10.0 if age is None else age / min_refresh
+        demand = _demand_score(symbol, now)
+        score = staleness * (1.0 + demand) * (1.0 + 2.0 * proximity)
+        candidates.append((-score, index, symbol))
+    candidates.sort()
+    return [symbol for _, __, symbol in candidates]
+
+
+def _twelve_credit_budget():
+    available = _available_credits()
+    now = time.time()
+    utc_now = datetime.utcnow()
+    midnight = datetime.combine(utc_now.date() + timedelta(days=1), dt_time(0, 0))
+    seconds_left = max(60.0, (midnight - utc_now).total_seconds())
+    per_second = min(
+        TWELVE_CREDITS_PER_MINUTE / 60.0,
+        _daily_remaining() / seconds_left,
+    )
+    capacity = float(TWELVE_CREDITS_PER_MINUTE)
+    if not _twelve_bucket["time"]:
+        _twelve_bucket["time"] = now
+    elapsed = max(0.0, now - _twelve_bucket["time"])
+    _twelve_bucket["tokens"] = min(
+        capacity, _twelve_bucket["tokens"] + elapsed * per_second
+    )
+    _twelve_bucket["time"] = now
+    return max(0, min(available, int(_twelve_bucket["tokens"])))
 
 
 def _min_symbol_refresh_sec():
@@ -4219,20 +5921,191 @@ def _min_symbol_refresh_sec():
     return value
 
 
-def _stock_provider():
-    config = load_config()
-    raw = (
-        os.environ.get("STOCK_DATA_PROVIDER", "").strip()
-        or str(config.get("stockDataProvider", "")).strip()
-    )
-    value = raw.lower()
+def _normalize_provider_name(value):
+    value = str(value or "").strip().lower()
     if value in ("twelvedata", "twelve", "twelve_data", "twelve-data"):
         return "twelvedata"
     if value in ("stooq",):
         return "stooq"
     if value in ("nasdaq", "ndaq"):
         return "nasdaq"
-    return "nasdaq"
+    return None
+
+
+def _stock_provider():
+    config = load_config()
+    raw = (
+        os.environ.get("STOCK_DATA_PROVIDER", "").strip()
+        or str(config.get("stockDataProvider", "")).strip()
+    )
+    return _normalize_provider_name(raw) or "nasdaq"
+
+
+def _stock_provider_chain():
+    config = load_config()
+    primary = _stock_provider()
+    env_value = os.environ.get("STOCK_DATA_PROVIDERS", "").strip()
+    if env_value:
+        configured = [item for item in env_value.split(",") if item.strip()]
+    else:
+        configured = _coerce_url_list(config.get("stockDataProviders"))
+    if not configured:
+        configured = list(QUOTE_PROVIDERS)
+    chain = [primary]
+    for name in configured:
+        provider = _normalize_provider_name(name)
+        if provider and provider != "twelvedata" and provider not in chain:
+            chain.append(provider)
+    return chain
+
+
+def _quote_hedge_percentile():
+    config = load_config()
+    raw = os.environ.get("QUOTE_HEDGE_PERCENTILE", "")
+    if not raw:
+        raw = config.get("quoteHedgePercentile", "")
+    if raw == "":
+        return DEFAULT_QUOTE_HEDGE_PERCENTILE
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return DEFAULT_QUOTE_HEDGE_PERCENTILE
+    if value > 1:
+        value = value / 100
+    return min(max(value, 0.0), 1.0)
+
+
+def _provider_health_entry(provider):
+    entry = _provider_health.get(provider)
+    if entry is None:
+        entry = {
+            "results": deque(maxlen=max(1, BREAKER_WINDOW)),
+            "latencies": deque(maxlen=max(1, BREAKER_WINDOW)),
+            "openUntil": 0.0,
+        }
+        _provider_health[provider] = entry
+    return entry
+
+
+def _record_provider_call(provider, ok, latency):
+    with _provider_health_lock:
+        entry = _provider_health_entry(provider)
+        entry["results"].append(bool(ok))
+        entry["latencies"].append(latency)
+        results = entry["results"]
+        latencies = sorted(entry["latencies"])
+        if len(results) < BREAKER_MIN_SAMPLES:
+            return
+        error_rate = results.count(False) / len(results)
+        median_latency = latencies[len(latencies) // 2]
+        if error_rate >= BREAKER_ERROR_RATE or median_latency >= BREAKER_LATENCY_SEC:
+            entry["openUntil"] = time.time() + BREAKER_COOLDOWN_SEC
+            entry["results"].clear()
+            entry["latencies"].clear()
+            app.logger.warning(
+                "provider_breaker_open provider=%s error_rate=%.2f median_latency=%.2f",
+                provider,
+                error_rate,
+                median_latency,
+            )
+
+
+def _provider_available(provider):
+    with _provider_health_lock:
+        entry = _provider_health_entry(provider)
+        return entry["openUntil"] <= time.time()
+
+
+def _provider_latency_percentile(provider, percentile):
+    with _provider_health_lock:
+        latencies = sorted(_provider_health_entry(provider)["latencies"])
+    if len(latencies) < BREAKER_MIN_SAMPLES:
+        return None
+    index = min(len(latencies) - 1, int(percentile * len(latencies)))
+    return latencies[index]
+
+
+def _is_valid_quote(quote):
+    return isinstance(quote, dict) and not quote.get("error") and (
+        quote.get("price") is not None
+    )
+
+
+def _cached_previous_close(symbol):
+    entry = _symbol_cache.get(symbol)
+    if entry and entry.get("data"):
+        return entry["data"].get("previousClose")
+    return None
+
+
+def _single_quote_fetcher(provider):
+    if provider == "nasdaq":
+        return _fetch_nasdaq_quote
+    if provider == "stooq":
+        return lambda symbol: _fetch_stooq_quote(symbol, _cached_previous_close(symbol))
+    return None
+
+
+def _timed_quote_call(provider, symbol):
+    fetcher = _single_quote_fetcher(provider)
+    started = time.monotonic()
+    try:
+        quote = fetcher(symbol)
+    except Exception:
+        quote = None
+    _record_provider_call(provider, _is_valid_quote(quote), time.monotonic() - started)
+    if _is_valid_quote(quote):
+        return dict(quote, source=provider)
+    return quote
+
+
+def _hedge_provider(provider):
+    for candidate in _stock_provider_chain():
+        if candidate == provider or _single_quote_fetcher(candidate) is None:
+            continue
+        if _provider_available(candidate):
+            return candidate
+    return None
+
+
+def _fetch_symbol_quote(provider, symbol):
+    percentile = _quote_hedge_percentile()
+    backup = _hedge_provider(provider) if percentile > 0 else None
+    delay = _provider_latency_percentile(provider, percentile) if backup else None
+    if delay is None:
+        return _timed_quote_call(provider, symbol)
+    primary = _hedge_executor.submit(_timed_quote_call, provider, symbol)
+    try:
+        quote = primary.result(timeout=delay)
+        if _is_valid_quote(quote):
+            return quote
+    except FuturesTimeout:
+        quote = None
+    except Exception:
+        quote = None
+    hedge = _hedge_executor.submit(_timed_quote_call, backup, symbol)
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                result = future.result()
+            except Exception:
+                continue
+            if _is_valid_quote(result):
+                return result
+            quote = quote or result
+    return quote
+
+
+def _fetch_provider_quotes(provider, symbols, api_key):
+    if provider == "twelvedata":
+        return fetch_quotes(symbols, api_key)
+    if provider == "nasdaq":
+        return fetch_nasdaq_quotes(symbols)
+    if provider == "stooq":
+        return fetch_stooq_quotes(symbols)
+    raise ValueError("Proveedor no soportado")
 
 
 def _reset_daily_credits_if_needed():
@@ -4341,9 +6214,8 @@ def _normalize_state(value):
 def _fetch_twelve_data(symbols, api_key):
     params = urllib.parse.urlencode({"symbol": ",".join(symbols), "apikey": api_key})
     url = f"{TWELVE_DATA_URL}?{params}"
-    request_obj = urllib.request.Request(url, headers=TWELVE_HEADERS)
-    with urllib.request.urlopen(request_obj, timeout=8) as response:
-        payload = response.read().decode("utf-8")
+    body, _ = _http_fetch(url, TWELVE_HEADERS, timeout=8)
+    payload = body.decode("utf-8")
     data = json.loads(payload)
     if isinstance(data, dict) and data.get("status") == "error":
         message = data.get("message") or "Error API"
@@ -4389,7 +6261,13 @@ def fetch_quotes(symbols, api_key):
     results = {}
     if not symbols:
         return results
-    payload = _fetch_twelve_data(symbols, api_key)
+    started = time.monotonic()
+    try:
+        payload = _fetch_twelve_data(symbols, api_key)
+    except Exception:
+        _record_provider_call("twelvedata", False, time.monotonic() - started)
+        raise
+    _record_provider_call("twelvedata", True, time.monotonic() - started)
     state = _market_state()
     now = datetime.now(MARKET_TZ)
     today = now.date().isoformat()
@@ -4449,80 +6327,106 @@ def fetch_quotes(symbols, api_key):
     return results
 
 
-@app.route("/")
-def index():
-    return send_from_directory(".", "index.html")
+def _set_symbol_cache(symbol, data, updated_at):
+    global _quote_seq
+    with _quote_changed:
+        previous = _symbol_cache.get(symbol)
+        if previous and previous.get("data") == data:
+            _symbol_cache[symbol] = dict(previous, updatedAt=updated_at)
+            return
+        _quote_seq += 1
+        _symbol_cache[symbol] = {
+            "data": data,
+            "updatedAt": updated_at,
+            "seq": _quote_seq,
+        }
+        _quote_changed.notify_all()
 
 
-@app.route("/ticker/<symbol>")
-def ticker_page(symbol):
-    return send_from_directory(".", "ticker.html")
+def _claim_quote_fetches(symbols):
+    owned = []
+    pending = []
+    with _quote_inflight_lock:
+        for symbol in symbols:
+            event = _quote_inflight.get(symbol)
+            if event is None:
+                _quote_inflight[symbol] = threading.Event()
+                owned.append(symbol)
+            else:
+                pending.append(event)
+    return owned, pending
 
 
-@app.route("/api/stocks")
-def api_stocks():
-    symbols = parse_symbols()
-    provider = _stock_provider()
-    api_key = None
-    if provider == "twelvedata":
-        api_key = (
-            request.args.get("apikey", "").strip()
-            or os.environ.get("TWELVE_DATA_KEY", "").strip()
-            or str(CONFIG.get("twelveDataKey", "")).strip()
-        )
-        if not api_key:
-            return (
-                jsonify(
-                    {
-                        "error": (
-                            "API key requerida (config.json o env TWELVE_DATA_KEY)"
-                        )
-                    }
-                ),
-                400,
-            )
+def _release_quote_fetches(symbols):
+    with _quote_inflight_lock:
+        for symbol in symbols:
+            event = _quote_inflight.pop(symbol, None)
+            if event is not None:
+                event.set()
+
 
+def _refresh_quotes(symbols, provider, api_key):
     refresh_list = []
     error_message = None
+    chain = _stock_provider_chain()
+    available = [name for name in chain if _provider_available(name)]
+    providers = available or chain[:1]
+    deferred = set()
     with _refresh_lock:
         if provider == "nasdaq":
             refresh_list = list(symbols)
         else:
-            if provider == "twelvedata":
-                refresh_budget = _available_credits()
-                rotation_list = _rotation_batch(
-                    symbols, min(8, TWELVE_CREDITS_PER_MINUTE, len(symbols))
-                )
+            if "twelvedata" in providers:
+                refresh_budget = _twelve_credit_budget()
+                refresh_candidates = _prioritized_symbols(symbols)
             else:
                 refresh_budget = len(symbols)
-                rotation_list = list(symbols)
-            refresh_candidates = _eligible_symbols(rotation_list)
+                refresh_candidates = _eligible_symbols(symbols)
             refresh_list = refresh_candidates[:refresh_budget]
-        if refresh_list:
-            try:
-                if provider == "twelvedata":
-                    quotes = fetch_quotes(refresh_list, api_key)
-                elif provider == "nasdaq":
-                    quotes = fetch_nasdaq_quotes(refresh_list)
-                elif provider == "stooq":
-                    quotes = fetch_stooq_quotes(refresh_list)
-                else:
-                    quotes = {}
-                    error_message = "Proveedor no soportado"
-            except Exception as exc:
-                quotes = {}
-                error_message = str(exc) or "Error API"
-                if provider == "twelvedata" and _is_daily_limit_error(
-                    error_message
-                ):
-                    _mark_daily_limit_reached()
-            if provider == "twelvedata":
-                _consume_credits(len(refresh_list))
+        refresh_list, _ = _claim_quote_fetches(refresh_list)
+    if refresh_list:
+        try:
+            quotes = {}
+            for name in providers:
+                failed = [
+                    symbol
+                    for symbol in refresh_list
+                    if not _is_valid_quote(quotes.get(symbol))
+                ]
+                if not failed:
+                    break
+                if name == "twelvedata":
+                    with _refresh_lock:
+                        allowed = _twelve_credit_budget()
+                        deferred.update(failed[allowed:])
+                        failed = failed[:allowed]
+                        if failed:
+                            _consume_credits(len(failed))
+                    if not failed:
+                        continue
+                try:
+                    fetched = _fetch_provider_quotes(name, failed, api_key)
+                except Exception as exc:
+                    if name == provider:
+                        error_message = str(exc) or "Error API"
+                        if provider == "twelvedata" and _is_daily_limit_error(
+                            error_message
+                        ):
+                            with _refresh_lock:
+                                _mark_daily_limit_reached()
+                    continue
+                for symbol, quote in fetched.items():
+                    if symbol in failed and (
+                        _is_valid_quote(quote) or symbol not in quotes
+                    ):
+                        quotes[symbol] = quote
             now = time.time()
             for symbol in refresh_list:
                 payload = quotes.get(symbol)
                 if payload:
-                    _symbol_cache[symbol] = {"data": payload, "updatedAt": now}
+                    _set_symbol_cache(symbol, payload, now)
+                elif symbol in deferred:
+                    continue
                 else:
                     if provider == "nasdaq":
                         fallback_error = "Error Nasdaq"
@@ -4531,46 +6435,290 @@ def api_stocks():
                     else:
                         fallback_error = "Error API"
                     error_text = error_message or fallback_error
-                    _symbol_cache[symbol] = {
-                        "data": {"error": error_text},
-                        "updatedAt": now,
-                    }
-    data = []
-    for symbol in symbols:
-        entry = _symbol_cache.get(symbol)
-        if not entry:
-            _log_price_metrics(symbol, None, None, None, None)
-            data.append({"symbol": symbol, "error": "Pendiente"})
-            continue
-        payload = dict(entry["data"])
-        payload["symbol"] = symbol
-        payload["updatedAt"] = entry["updatedAt"]
-        _log_price_metrics(
-            symbol,
-            payload.get("price"),
-            payload.get("previousClose"),
-            payload.get("change"),
-            payload.get("changePercent"),
+                    _set_symbol_cache(symbol, {"error": error_text}, now)
+        finally:
+            _release_quote_fetches(refresh_list)
+    return len(refresh_list), error_message
+
+
+def _quote_refresh_interval_sec():
+    config = load_config()
+    raw = os.environ.get("QUOTE_REFRESH_INTERVAL_SEC", "")
+    if not raw:
+        raw = config.get("quoteRefreshIntervalSec", "")
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        value = DEFAULT_QUOTE_REFRESH_INTERVAL_SEC
+    if value <= 0:
+        value = DEFAULT_QUOTE_REFRESH_INTERVAL_SEC
+    return value
+
+
+def _quote_api_key_for(provider):
+    if provider != "twelvedata":
+        return None
+    return (
+        os.environ.get("TWELVE_DATA_KEY", "").strip()
+        or str(CONFIG.get("twelveDataKey", "")).strip()
+    )
+
+
+def _watch_symbols(symbols):
+    now = time.time()
+    with _watch_lock:
+        for symbol in symbols:
+            _watched_symbols[symbol] = now
+            _symbol_demand[symbol] = _demand_score(symbol, now) + 1.0, now
+    _ensure_quote_refresher()
+    if any(symbol not in _symbol_cache for symbol in symbols):
+        _quote_refresher_wake.set()
+
+
+def _wait_for_cold_quotes(symbols, timeout):
+    deadline = time.time() + timeout
+    with _quote_changed:
+        while any(symbol not in _symbol_cache for symbol in symbols):
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            _quote_changed.wait(remaining)
+
+
+def _active_symbols():
+    now = time.time()
+    with _watch_lock:
+        expired = [
+            symbol
+            for symbol, seen_at in _watched_symbols.items()
+            if (now - seen_at) >= WATCHED_SYMBOL_TTL
+        ]
+        for symbol in expired:
+            del _watched_symbols[symbol]
+        return list(_watched_symbols)
+
+
+def _run_quote_refresh(only_missing=False):
+    symbols = _active_symbols()
+    if only_missing:
+        symbols = [symbol for symbol in symbols if symbol not in _symbol_cache]
+    if not symbols:
+        return
+    provider = _stock_provider()
+    api_key = _quote_api_key_for(provider)
+    if provider == "twelvedata" and not api_key:
+        return
+    try:
+        refreshed, error_message = _refresh_quotes(symbols, provider, api_key)
+    except Exception as exc:
+        refreshed, error_message = 0, str(exc) or "Error API"
+    _quote_refresh_state.update(
+        {"refreshed": refreshed, "error": error_message, "time": time.time()}
+    )
+
+
+def _quote_refresher_loop():
+    last_run = 0.0
+    while True:
+        interval = _quote_refresh_interval_sec()
+        woken = _quote_refresher_wake.wait(
+            timeout=max(0.0, last_run + interval - time.time())
+        )
+        _quote_refresher_wake.clear()
+        if (time.time() - last_run) >= interval:
+            last_run = time.time()
+            _run_quote_refresh()
+        elif woken:
+            _run_quote_refresh(only_missing=True)
+
+
+def _ensure_quote_refresher():
+    global _quote_refresher_thread
+    if _quote_refresher_thread is not None and _quote_refresher_thread.is_alive():
+        return
+    with _watch_lock:
+        if _quote_refresher_thread is not None and _quote_refresher_thread.is_alive():
+            return
+        _quote_refresher_thread = threading.Thread(
+            target=_quote_refresher_loop,
+            name="quote-refresher",
+            daemon=True,
+        )
+        _quote_refresher_thread.start()
+
+
+@app.route("/")
+def index():
+    return send_from_directory(".", "index.html")
+
+
+@app.route("/ticker/<symbol>")
+def ticker_page(symbol):
+    return send_from_directory(".", "ticker.html")
+
+
+def _stock_payload(symbol):
+    entry = _symbol_cache.get(symbol)
+    if not entry:
+        _log_price_metrics(symbol, None, None, None, None)
+        return {"symbol": symbol, "error": "Pendiente"}
+    payload = dict(entry["data"])
+    payload["symbol"] = symbol
+    payload["updatedAt"] = entry["updatedAt"]
+    _log_price_metrics(
+        symbol,
+        payload.get("price"),
+        payload.get("previousClose"),
+        payload.get("change"),
+        payload.get("changePercent"),
+    )
+    return payload
+
+
+def _stocks_meta(provider):
+    return {
+        "creditsPerMinute": (
+            TWELVE_CREDITS_PER_MINUTE
+            if provider == "twelvedata"
+            else 0
+        ),
+        "refreshed": _quote_refresh_state["refreshed"],
+        "error": _quote_refresh_state["error"],
+        "provider": provider,
+    }
+
+
+def _stream_event(event_id, event_name, payload):
+    data = json.dumps(payload, ensure_ascii=True)
+    return f"id: {event_id}\nevent: {event_name}\ndata: {data}\n\n"
+
+
+@app.route("/api/stocks")
+def api_stocks():
+    symbols = parse_symbols()
+    provider = _stock_provider()
+    api_key = _quote_api_key_for(provider)
+    if provider == "twelvedata" and not api_key:
+        return (
+            jsonify(
+                {
+                    "error": (
+                        "API key requerida (config.json o env TWELVE_DATA_KEY)"
+                    )
+                }
+            ),
+            400,
         )
-        data.append(payload)
+
+    _watch_symbols(symbols)
+    _wait_for_cold_quotes(symbols, COLD_QUOTE_WAIT_SEC)
+    data = [_stock_payload(symbol) for symbol in symbols]
 
     response = {
         "updatedAt": int(time.time()),
         "data": data,
-        "meta": {
-            "creditsPerMinute": (
-                TWELVE_CREDITS_PER_MINUTE
-                if provider == "twelvedata"
-                else 0
-            ),
-            "refreshed": len(refresh_list),
-            "error": error_message,
-            "provider": provider,
-        },
+        "meta": _stocks_meta(provider),
     }
     return jsonify(response)
 
 
+@app.route("/api/stream/stocks")
+def api_stream_stocks():
+    symbols = parse_symbols()
+    provider = _stock_provider()
+    api_key = _quote_api_key_for(provider)
+    if provider == "twelvedata" and not api_key:
+        return (
+            jsonify(
+                {
+                    "error": (
+                        "API key requerida (config.json o env TWELVE_DATA_KEY)"
+                    )
+                }
+            ),
+            400,
+        )
+    raw_last_id = (
+        request.headers.get("Last-Event-ID", "").strip()
+        or request.args.get("lastEventId", "").strip()
+    )
+    try:
+        last_id = int(raw_last_id)
+    except ValueError:
+        last_id = 0
+    if last_id > _quote_seq:
+        last_id = 0
+
+    def generate():
+        sent_id = last_id
+        touched = {}
+        yield f"retry: {STREAM_RETRY_MS}\n\n"
+        _watch_symbols(symbols)
+        _wait_for_cold_quotes(symbols, COLD_QUOTE_WAIT_SEC)
+        first = True
+        while True:
+            with _quote_changed:
+                current_id = _quote_seq
+                changed = [
+                    symbol
+                    for symbol in symbols
+                    if (_symbol_cache.get(symbol) or {}).get("seq", 0) > sent_id
+                ]
+                if not changed and not first:
+                    _quote_changed.wait(timeout=STREAM_HEARTBEAT_SEC)
+                    current_id = _quote_seq
+                    changed = [
+                        symbol
+                        for symbol in symbols
+                        if (_symbol_cache.get(symbol) or {}).get("seq", 0) > sent_id
+                    ]
+            if first and not sent_id:
+                changed = list(symbols)
+            sent_id = max(sent_id, current_id)
+            if changed or first:
+                data = [_stock_payload(symbol) for symbol in changed]
+                for item in data:
+                    if item.get("updatedAt"):
+                        touched[item["symbol"]] = item["updatedAt"]
+                yield _stream_event(
+                    sent_id,
+                    "quotes",
+                    {
+                        "updatedAt": int(time.time()),
+                        "data": data,
+                        "meta": _stocks_meta(provider),
+                    },
+                )
+            touches = {}
+            for symbol in symbols:
+                entry = _symbol_cache.get(symbol) or {}
+                if (entry.get("data") or {}).get("error"):
+                    continue
+                updated_at = entry.get("updatedAt")
+                if updated_at and updated_at > touched.get(symbol, 0):
+                    touches[symbol] = updated_at
+            if touches:
+                touched.update(touches)
+                yield _stream_event(
+                    sent_id,
+                    "touch",
+                    {"updatedAt": int(time.time()), "data": touches},
+                )
+            elif not (changed or first):
+                yield ": heartbeat\n\n"
+            first = False
+            _watch_symbols(symbols)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @app.route("/api/chart")
 def api_chart():
     symbol = request.args.get("symbol", "").strip()
@@ -4607,6 +6755,20 @@ def api_filings():
         return jsonify({"error": str(exc) or "Error API"}), 502
 
 
+@app.route("/api/insiders")
+def api_insiders():
+    symbol = request.args.get("symbol", "").strip()
+    try:
+        if symbol:
+            data = _get_insider_summary(symbol)
+            return jsonify({"symbol": symbol.upper(), "data": data})
+        symbols = parse_symbols()
+        data = {item: _get_insider_summary(item) for item in symbols}
+        return jsonify({"data": data})
+    except Exception as exc:
+        return jsonify({"error": str(exc) or "Error API"}), 502
+
+
 @app.route("/api/news")
 def api_news():
     symbol = request.args.get("symbol", "").strip()
@@ -4657,6 +6819,11 @@ def api_events():
         return jsonify({"error": str(exc) or "Error API"}), 502
 
 
+@app.route("/api/upstream")
+def api_upstream():
+    return jsonify({"data": _http_stats_snapshot()})
+
+
 @app.route("/api/lan")
 def api_lan():
     host = request.host.split(":")[0]